@@ -122,15 +122,14 @@ class TestBookings:
         patch_booking = auth_session.patch(f"{BASE_URL}/booking/{booking_id}", json={})
         assert patch_booking.status_code == 200
         get_patch_booking = auth_session.get(f"{BASE_URL}/booking/{booking_id}")
-        assert get_patch_booking.json() == {'firstname': 'Richard', 'lastname': 'Gentle', 'totalprice': 999, 'depositpaid': True, 'bookingdates': {'checkin': '2024-04-05', 'checkout': '2024-04-08'}, 'additionalneeds': 'Dinner'}
+        expected_booking = {**booking_data_change, **booking_data_patch}
+        assert get_patch_booking.json() == expected_booking
 
         #Проверка PATCH с не существующими данными
         patch_booking = auth_session.patch(f"{BASE_URL}/booking/{booking_id}", json={"proverka": 345})
         assert patch_booking.status_code == 200
-        assert get_patch_booking.json() == {'firstname': 'Richard', 'lastname': 'Gentle', 'totalprice': 999,
-                                            'depositpaid': True,
-                                            'bookingdates': {'checkin': '2024-04-05', 'checkout': '2024-04-08'},
-                                            'additionalneeds': 'Dinner'}
+        get_patch_booking = auth_session.get(f"{BASE_URL}/booking/{booking_id}")
+        assert get_patch_booking.json() == expected_booking
 
         #Проверка Get (без ID)
         getnoid_booking = auth_session.get(f"{BASE_URL}/booking/")
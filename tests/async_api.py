@@ -0,0 +1,66 @@
+import asyncio
+
+import pytest
+
+
+async def booking_lifecycle(client, booking_data: dict) -> None:
+    """
+    Проходит полный цикл бронирования: создание, получение, PUT, PATCH и удаление.
+
+    Args:
+        client (AsyncBookingClient): Авторизованный асинхронный клиент.
+        booking_data (dict): Данные для создания бронирования.
+    """
+    create_booking = await client.create_booking(booking_data)
+    assert create_booking.status == 200
+    booking_id = create_booking.data.get("bookingid")
+    assert booking_id is not None, "ID букинга не найден в ответе"
+
+    get_booking = await client.get_booking(booking_id)
+    assert get_booking.status == 200
+    assert get_booking.data["firstname"] == booking_data["firstname"], "Имя не совпадает с заданным"
+
+    put_booking = await client.update_booking(booking_id, {**booking_data, "totalprice": 999})
+    assert put_booking.status == 200
+    assert put_booking.data["totalprice"] == 999, "Цена не совпадает с заданной"
+
+    patch_booking = await client.partial_update_booking(booking_id, {"additionalneeds": "Dinner"})
+    assert patch_booking.status == 200
+    assert patch_booking.data["additionalneeds"] == "Dinner", "Доп. пожелания не совпадают"
+
+    delete_booking = await client.delete_booking(booking_id)
+    assert delete_booking.status == 201, f"Ошибка при удалении букинга с ID {booking_id}"
+
+    get_deleted_booking = await client.get_booking(booking_id)
+    assert get_deleted_booking.status == 404, "Букинг не был удален"
+
+
+class TestAsyncBookings:
+    """
+    Класс для тестирования бронирований через асинхронный клиент.
+    """
+
+    @pytest.mark.asyncio
+    async def test_concurrent_lifecycles(self, async_booking_client, booking_factory):
+        """
+        Запускает 100 независимых жизненных циклов бронирования одновременно.
+        """
+        await asyncio.gather(*(booking_lifecycle(async_booking_client, booking_data)
+                               for booking_data in booking_factory.batch(100)))
+
+    @pytest.mark.asyncio
+    async def test_get_booking_ids_filter(self, async_booking_client, booking_data):
+        """
+        Проверяет фильтрацию списка бронирований по firstname и lastname.
+        """
+        create_booking = await async_booking_client.create_booking(booking_data)
+        booking_id = create_booking.data["bookingid"]
+        assert booking_id in async_booking_client.booking_ids, "Созданный букинг не отслеживается для очистки"
+
+        get_ids = await async_booking_client.get_booking_ids(booking_data["firstname"], booking_data["lastname"])
+        assert get_ids.status == 200
+        assert {"bookingid": booking_id} in get_ids.data
+
+        delete_booking = await async_booking_client.delete_booking(booking_id)
+        assert delete_booking.status == 201
+        assert booking_id not in async_booking_client.booking_ids
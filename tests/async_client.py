@@ -0,0 +1,139 @@
+import time
+from dataclasses import dataclass
+from typing import Any, Callable, Optional
+
+import aiohttp
+
+from constant import HEADERS
+
+
+@dataclass
+class ApiResponse:
+    """
+    Ответ API бронирований.
+
+    Атрибуты:
+        status (int): HTTP статус ответа.
+        data (Any): Тело ответа: разобранный JSON или текст, если сервер вернул не JSON.
+    """
+    status: int
+    data: Any
+
+    def json(self) -> Any:
+        """Возвращает тело ответа (по аналогии с requests.Response.json)."""
+        return self.data
+
+
+class AsyncBookingClient:
+    """
+    Асинхронный клиент restful-booker с ограниченным пулом keep-alive соединений.
+
+    Независимые запросы идут по разным соединениям пула, поэтому сотни жизненных циклов
+    бронирований могут выполняться одновременно, не дожидаясь друг друга.
+
+    Атрибуты:
+        base_url (str): Адрес API.
+        token (str | None): Токен, полученный методом auth().
+        on_response (Callable | None): Вызывается после каждого запроса с аргументами
+            (метод, шаблон пути, статус, время в секундах).
+        booking_ids (set): ID бронирований, созданных клиентом и ещё не удалённых им.
+    """
+    def __init__(self, base_url: str, pool_size: int = 100, keepalive_timeout: float = 30,
+                 timeout: float = 30) -> None:
+        """
+        Args:
+            base_url (str): Адрес API.
+            pool_size (int, optional): Максимум одновременно открытых соединений.
+            keepalive_timeout (float, optional): Сколько секунд держать простаивающее соединение.
+            timeout (float, optional): Общий таймаут одного запроса в секундах.
+        """
+        self.base_url = base_url
+        self.token = None
+        self.booking_ids = set()
+        self.on_response: Optional[Callable[[str, str, int, float], None]] = None
+        self._pool_size = pool_size
+        self._keepalive_timeout = keepalive_timeout
+        self._timeout = timeout
+        self._session = None
+
+    async def __aenter__(self) -> "AsyncBookingClient":
+        await self.open()
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.close()
+
+    async def open(self) -> None:
+        """Создаёт HTTP сессию с пулом соединений."""
+        connector = aiohttp.TCPConnector(limit=self._pool_size, keepalive_timeout=self._keepalive_timeout)
+        self._session = aiohttp.ClientSession(
+            connector=connector,
+            headers=HEADERS,
+            timeout=aiohttp.ClientTimeout(total=self._timeout),
+        )
+
+    async def close(self) -> None:
+        """Закрывает сессию и все соединения пула."""
+        if self._session is not None:
+            await self._session.close()
+            self._session = None
+
+    async def request(self, method: str, path: str, endpoint: Optional[str] = None, **kwargs) -> ApiResponse:
+        """
+        Выполняет запрос к API и полностью вычитывает ответ, возвращая соединение в пул.
+
+        Args:
+            method (str): HTTP метод.
+            path (str): Путь относительно base_url, например "/booking/1".
+            endpoint (str, optional): Шаблон пути для on_response, например "/booking/{id}".
+            **kwargs: Дополнительные аргументы aiohttp (json, params, ...).
+        """
+        headers = {"Cookie": f"token={self.token}"} if self.token else None
+        started = time.perf_counter()
+        async with self._session.request(method, f"{self.base_url}{path}", headers=headers, **kwargs) as response:
+            if response.content_type == "application/json":
+                data = await response.json()
+            else:
+                data = await response.text()
+        if self.on_response is not None:
+            self.on_response(method, endpoint or path, response.status, time.perf_counter() - started)
+        return ApiResponse(response.status, data)
+
+    async def auth(self, username: str = "admin", password: str = "password123") -> ApiResponse:
+        """Получает токен и использует его в последующих запросах."""
+        response = await self.request("POST", "/auth", json={"username": username, "password": password})
+        if response.status == 200 and isinstance(response.data, dict):
+            self.token = response.data.get("token")
+        return response
+
+    async def create_booking(self, booking: dict) -> ApiResponse:
+        """POST /booking"""
+        response = await self.request("POST", "/booking", json=booking)
+        if response.status == 200 and isinstance(response.data, dict):
+            self.booking_ids.add(response.data["bookingid"])
+        return response
+
+    async def get_booking(self, booking_id: int) -> ApiResponse:
+        """GET /booking/{id}"""
+        return await self.request("GET", f"/booking/{booking_id}", "/booking/{id}")
+
+    async def get_booking_ids(self, firstname: Optional[str] = None,
+                              lastname: Optional[str] = None) -> ApiResponse:
+        """GET /booking с необязательными фильтрами firstname и lastname."""
+        params = {key: value for key, value in (("firstname", firstname), ("lastname", lastname)) if value}
+        return await self.request("GET", "/booking", params=params)
+
+    async def update_booking(self, booking_id: int, booking: dict) -> ApiResponse:
+        """PUT /booking/{id}"""
+        return await self.request("PUT", f"/booking/{booking_id}", "/booking/{id}", json=booking)
+
+    async def partial_update_booking(self, booking_id: int, fields: dict) -> ApiResponse:
+        """PATCH /booking/{id}"""
+        return await self.request("PATCH", f"/booking/{booking_id}", "/booking/{id}", json=fields)
+
+    async def delete_booking(self, booking_id: int) -> ApiResponse:
+        """DELETE /booking/{id}"""
+        response = await self.request("DELETE", f"/booking/{booking_id}", "/booking/{id}")
+        if response.status == 201:
+            self.booking_ids.discard(booking_id)
+        return response
@@ -0,0 +1,284 @@
+import argparse
+import asyncio
+import gc
+import json
+import os
+import platform
+import sys
+import tempfile
+import time
+
+import requests
+
+import orders
+from constant import HEADERS
+from fake_booker import FakeBooker
+from ledger import Ledger
+from load import run_load
+from oop_practic import SavingsAccount
+from order_columns import OrderColumns, synthetic_orders
+from order_stream import make_stream_report
+from payloads import BookingFactory
+from timeparse import parse_iso
+from transactions import TransactionProcessor, random_transactions
+
+DEFAULT_BASELINE = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+                                ".benchmarks", "baseline.json")
+DEFAULT_THRESHOLD = 0.2
+
+# Бенчмарки по имени метрики. Каждый принимает масштаб и возвращает (функция замера, число операций)
+# или (функция замера, число операций, функция очистки): подготовка и очистка (остановка сервера,
+# удаление файлов) не входят во время, а метрика — микросекунды на одну операцию (меньше — лучше).
+BENCHMARKS = {}
+
+
+def benchmark(name: str):
+    def register(func):
+        BENCHMARKS[name] = func
+        return func
+    return register
+
+
+@benchmark("booking.lifecycle_sync_us")
+def bench_booking_sync(scale: int):
+    """Цикл из TestBookings.test_create_booking через requests против локального restful-booker."""
+    server = FakeBooker().start()
+    session = requests.Session()
+    session.headers.update(HEADERS)
+    token = session.post(f"{server.base_url}/auth", json={"username": "admin", "password": "password123"}).json()["token"]
+    session.headers.update({"Cookie": f"token={token}"})
+    payloads = BookingFactory(0).batch(100 * scale)
+
+    def run():
+        for booking_data in payloads:
+            booking_id = session.post(f"{server.base_url}/booking", json=booking_data).json()["bookingid"]
+            assert session.get(f"{server.base_url}/booking/{booking_id}").status_code == 200
+            assert session.delete(f"{server.base_url}/booking/{booking_id}").status_code == 201
+            assert session.get(f"{server.base_url}/booking/{booking_id}").status_code == 404
+
+    def cleanup():
+        session.close()
+        server.stop()
+
+    return run, len(payloads), cleanup
+
+
+@benchmark("booking.lifecycle_async_us")
+def bench_booking_async(scale: int):
+    """Полные циклы бронирований из load.run_load, 20 одновременно, против локального restful-booker."""
+    iterations = 200 * scale
+    server = FakeBooker().start()
+
+    def run():
+        report = asyncio.run(run_load(server.base_url, concurrency=20, duration=3600, iterations=iterations))
+        assert report["errors"] == {}, report["errors"]
+
+    return run, iterations, server.stop
+
+
+@benchmark("orders.order_errors_us")
+def bench_order_errors(scale: int):
+    """Проверка каждого заказа правилами test_orders (orders.order_errors)."""
+    data = synthetic_orders(20_000 * scale)
+    return (lambda: [orders.order_errors(order) for order in data]), len(data)
+
+
+@benchmark("orders.make_report_us")
+def bench_make_report(scale: int):
+    """make_report на большом наборе заказов вместо трёх заказов из примера."""
+    data = synthetic_orders(100_000 * scale)
+
+    def run():
+        original = orders.orders["data"]
+        orders.orders["data"] = data
+        try:
+            orders.make_report()
+        finally:
+            orders.orders["data"] = original
+
+    return run, len(data)
+
+
+@benchmark("orders.stream_report_us")
+def bench_stream_report(scale: int):
+    """Потоковый отчёт order_stream.make_stream_report по NDJSON выгрузке."""
+    data = synthetic_orders(20_000 * scale)
+    file = tempfile.NamedTemporaryFile("w", suffix=".ndjson", delete=False, encoding="utf-8")
+    with file:
+        for order in data:
+            file.write(json.dumps(order) + "\n")
+
+    def run():
+        assert make_stream_report(file.name)["orders"] == len(data)
+
+    return run, len(data), lambda: os.remove(file.name)
+
+
+@benchmark("orders.columns_violations_us")
+def bench_columns(scale: int):
+    """Векторные проверки OrderColumns.violations."""
+    columns = OrderColumns.from_orders(synthetic_orders(100_000 * scale))
+    return columns.violations, len(columns)
+
+
+@benchmark("accounts.objects_us")
+def bench_account_objects(scale: int):
+    """Депозит, снятие и проценты для каждого объекта SavingsAccount."""
+    accounts = [SavingsAccount(f"owner-{i}", 100) for i in range(200_000 * scale)]
+
+    def run():
+        for account in accounts:
+            account.deposit(50)
+            account.withdraw(25)
+            account.apply_interest()
+
+    return run, len(accounts)
+
+
+@benchmark("accounts.ledger_us")
+def bench_ledger(scale: int):
+    """Те же операции пакетно в Ledger."""
+    n = 500_000 * scale
+    ledger = Ledger(capacity=n)
+    indices = ledger.open_many([""] * n, [100] * n, SavingsAccount)
+    amounts_in, amounts_out = [50.0] * n, [25.0] * n
+
+    def run():
+        ledger.deposit_many(indices, amounts_in)
+        ledger.withdraw_many(indices, amounts_out)
+        ledger.apply_interest()
+
+    return run, n
+
+
+@benchmark("accounts.processor_us")
+def bench_processor(scale: int):
+    """
+    Накладные расходы TransactionProcessor.process на потоке депозитов, снятий и переводов.
+
+    Это не путь пропускной способности: под GIL process медленнее последовательного выполнения,
+    метрика следит за тем, чтобы согласование очередей шардов не становилось дороже.
+    """
+    accounts = [SavingsAccount(f"owner-{i}", 1000) for i in range(1000)]
+    processor = TransactionProcessor(accounts)
+    transactions = random_transactions(50_000 * scale, len(accounts), seed=0)
+    return (lambda: processor.process(transactions)), len(transactions)
+
+
+def run_benchmarks(scale: int = 1, repeat: int = 5, only: str = "") -> dict:
+    """
+    Выполняет бенчмарки и возвращает лучшее из repeat замеров для каждой метрики.
+
+    Args:
+        scale (int, optional): Множитель размера входных данных.
+        repeat (int, optional): Сколько раз повторять каждый замер.
+        only (str, optional): Запускать только метрики с этим префиксом.
+    """
+    metrics = {}
+    for name, prepare in BENCHMARKS.items():
+        if not name.startswith(only):
+            continue
+        timings = []
+        for _ in range(repeat):
+            run, operations, *cleanup = prepare(scale)
+            # Все бенчмарки заказов используют одни и те же даты: без очистки кэш parse_iso оставался бы
+            # тёплым между повторами, и замерялись бы попадания в кэш, а не разбор
+            parse_iso.cache_clear()
+            # Как в timeit: сборщик мусора не должен срабатывать посреди замера
+            gc.collect()
+            gc.disable()
+            try:
+                started = time.perf_counter()
+                run()
+                timings.append((time.perf_counter() - started) / operations * 1e6)
+            finally:
+                gc.enable()
+                for func in cleanup:
+                    func()
+        metrics[name] = round(min(timings), 4)
+    return {
+        "scale": scale,
+        "python": platform.python_version(),
+        "machine": platform.machine(),
+        "metrics": metrics,
+    }
+
+
+def compare(results: dict, baseline: dict, threshold: float = DEFAULT_THRESHOLD) -> list:
+    """
+    Сравнивает результаты с эталоном.
+
+    Returns:
+        list: Описания метрик, которые стали медленнее эталона больше чем на threshold (доля).
+    """
+    regressions = []
+    for name, value in results["metrics"].items():
+        reference = baseline["metrics"].get(name)
+        if reference and value > reference * (1 + threshold):
+            regressions.append(f"{name}: {value} мкс против {reference} мкс в эталоне "
+                               f"(+{(value / reference - 1) * 100:.0f}%)")
+    return regressions
+
+
+def test_compare_detects_regressions() -> None:
+    """
+    Проверяет, что регрессия выше порога обнаруживается, а ускорение и новые метрики — нет.
+    """
+    baseline = {"metrics": {"a": 10.0, "b": 10.0, "c": 10.0}}
+    results = {"metrics": {"a": 12.5, "b": 11.0, "c": 5.0, "d": 100.0}}
+    assert compare(results, baseline, threshold=0.2) == ["a: 12.5 мкс против 10.0 мкс в эталоне (+25%)"]
+
+
+def test_benchmarks_smoke() -> None:
+    """
+    Прогоняет бенчмарки заказов и счетов один раз, чтобы они не ломались незаметно.
+    """
+    for prefix in ("orders.", "accounts."):
+        metrics = run_benchmarks(scale=1, repeat=1, only=prefix)["metrics"]
+        assert metrics and all(value > 0 for value in metrics.values())
+
+
+def main() -> int:
+    arg_parser = argparse.ArgumentParser(description="Бенчмарки бронирований, заказов и счетов")
+    arg_parser.add_argument("--scale", type=int, default=1, help="множитель размера входных данных")
+    arg_parser.add_argument("--repeat", type=int, default=5, help="повторов каждого замера (берётся лучший)")
+    arg_parser.add_argument("--only", default="", help="запускать только метрики с этим префиксом")
+    arg_parser.add_argument("--output", help="сохранить результаты в JSON")
+    arg_parser.add_argument("--baseline", default=DEFAULT_BASELINE, help="путь к эталонным результатам")
+    arg_parser.add_argument("--save-baseline", action="store_true", help="записать результаты как эталон")
+    arg_parser.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD,
+                            help="допустимое замедление относительно эталона (доля, 0.2 = 20%%)")
+    args = arg_parser.parse_args()
+
+    results = run_benchmarks(args.scale, args.repeat, args.only)
+    for name, value in results["metrics"].items():
+        print(f"{name:<32}{value:>14.4f} мкс/операцию")
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as file:
+            json.dump(results, file, indent=2)
+
+    if args.save_baseline:
+        os.makedirs(os.path.dirname(args.baseline), exist_ok=True)
+        with open(args.baseline, "w", encoding="utf-8") as file:
+            json.dump(results, file, indent=2)
+        print(f"Эталон сохранён в {args.baseline}")
+        return 0
+    if not os.path.exists(args.baseline):
+        print(f"Эталон {args.baseline} не найден, сравнение пропущено (запустите с --save-baseline)")
+        return 0
+    with open(args.baseline, encoding="utf-8") as file:
+        baseline = json.load(file)
+    if baseline.get("scale") != results["scale"]:
+        print(f"Эталон снят с --scale {baseline.get('scale')}, текущий прогон — {results['scale']}: "
+              f"сравнение невозможно (перезапустите с тем же --scale или обновите эталон)")
+        return 2
+    regressions = compare(results, baseline, args.threshold)
+    for regression in regressions:
+        print(f"РЕГРЕССИЯ {regression}")
+    if not regressions:
+        print(f"Регрессий нет (порог {args.threshold:.0%})")
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,42 +1,204 @@
+import asyncio
+import inspect
+import os
+import random
+from urllib.parse import urlsplit
+
 import pytest
-from constant import BASE_URL, HEADERS
+import constant
+import http_timing
+from constant import HEADERS
+from fake_booker import FakeBooker
 import requests
-from faker import Faker
-fake = Faker()
+
+# Асинхронные фикстуры нужны только tests/async_api.py и tests/seeding.py: без pytest-asyncio
+# остальные тесты запускаются как обычно (зависимости перечислены в requirements.txt)
+try:
+    import pytest_asyncio
+except ImportError:
+    pytest_asyncio = None
+
+# Имя воркера pytest-xdist (gw0, gw1, ...); None при обычном запуске
+WORKER = os.getenv("PYTEST_XDIST_WORKER")
+
+
+def namespaced(lastname: str) -> str:
+    """Добавляет к фамилии имя воркера, чтобы бронирования параллельных воркеров не пересекались."""
+    return f"{lastname}-{WORKER}" if WORKER else lastname
+
+
+class BookingTracker:
+    """
+    Отслеживает бронирования, созданные через сессию, чтобы удалить оставшиеся после тестов.
+
+    Атрибуты:
+        booking_ids (set): ID созданных и ещё не удалённых бронирований.
+    """
+    def __init__(self) -> None:
+        self.booking_ids = set()
+
+    def __call__(self, response, *args, **kwargs):
+        """Хук requests: запоминает ID из POST /booking и забывает ID после успешного DELETE."""
+        path = urlsplit(response.request.url).path.rstrip("/")
+        method = response.request.method
+        if method == "POST" and path.endswith("/booking") and response.status_code == 200:
+            self.booking_ids.add(response.json()["bookingid"])
+        elif method == "DELETE" and response.status_code == 201:
+            self.booking_ids.discard(int(path.rsplit("/", 1)[-1]))
+        return response
+
+    def cleanup(self, session) -> None:
+        """Удаляет все бронирования, которые тесты не удалили сами."""
+        for booking_id in list(self.booking_ids):
+            session.delete(f"{constant.BASE_URL}/booking/{booking_id}")
+        self.booking_ids.clear()
+
+
+def pytest_addoption(parser):
+    group = parser.getgroup("http-timings", "замеры HTTP вызовов auth_session")
+    group.addoption("--http-timings", action="store_true",
+                    help="замерять каждый HTTP вызов и показать самые медленные в итоговом отчёте")
+    group.addoption("--http-timings-json", metavar="PATH",
+                    help="сохранить замеры HTTP вызовов в JSON (включает --http-timings)")
+
+
+def pytest_configure(config):
+    """При BOOKER_BASE_URL=fake поднимает локальный restful-booker и направляет BASE_URL на него."""
+    if constant.BASE_URL == constant.FAKE_BASE_URL:
+        server = FakeBooker().start()
+        constant.BASE_URL = server.base_url
+        config.add_cleanup(server.stop)
+    enabled = config.getoption("http_timings") or config.getoption("http_timings_json")
+    config.http_calls = [] if enabled else None
+    # Зерно данных бронирований; воркеры xdist наследуют его через окружение
+    os.environ.setdefault("BOOKER_SEED", str(random.randrange(2 ** 32)))
+    if pytest_asyncio is None:
+        config.addinivalue_line("markers", "asyncio: асинхронный тест (нужен pytest-asyncio)")
+
+
+def pytest_collection_modifyitems(items):
+    """Без pytest-asyncio асинхронные тесты пропускаются, а не падают."""
+    if pytest_asyncio is not None:
+        return
+    skip = pytest.mark.skip(reason="для асинхронных тестов нужны pytest-asyncio и aiohttp")
+    for item in items:
+        if inspect.iscoroutinefunction(getattr(item, "function", None)):
+            item.add_marker(skip)
+
+
+def pytest_report_header(config):
+    return f"booking data seed: BOOKER_SEED={os.environ['BOOKER_SEED']}"
+
+
+def pytest_sessionfinish(session):
+    """В воркере xdist передаёт замеры HTTP вызовов в главный процесс."""
+    calls = session.config.http_calls
+    if calls is not None and hasattr(session.config, "workeroutput"):
+        session.config.workeroutput["http_calls"] = [http_timing.asdict(call) for call in calls]
+
+
+@pytest.hookimpl(optionalhook=True)
+def pytest_testnodedown(node, error):
+    """Собирает замеры HTTP вызовов, пришедшие от воркера xdist."""
+    calls = node.config.http_calls
+    if calls is not None:
+        calls.extend(http_timing.CallTiming(**call) for call in node.workeroutput.get("http_calls", []))
+
+
+def pytest_terminal_summary(terminalreporter, config):
+    calls = config.http_calls
+    if not calls or hasattr(config, "workeroutput"):
+        return
+    http_timing.write_report(terminalreporter, calls)
+    if config.getoption("http_timings_json"):
+        http_timing.dump_json(config.getoption("http_timings_json"), calls)
 
 
 @pytest.fixture(scope="session")
-def auth_session():
-    """Создаёт сессию с авторизацией и возвращает объект сессии."""
+def auth_session(pytestconfig):
+    """
+    Создаёт сессию с авторизацией и возвращает объект сессии.
+
+    Под pytest-xdist фикстура создаётся в каждом воркере отдельно, поэтому у каждого воркера
+    своя сессия и свой токен. После завершения сессии удаляются все бронирования, созданные воркером.
+    С опцией --http-timings каждый вызов сессии замеряется (см. http_timing.py).
+    Токен берётся из дискового кэша, общего для всех процессов, и обновляется при ответе 403.
+    """
     session = requests.Session()
     session.headers.update(HEADERS)
+    if pytestconfig.http_calls is not None:
+        http_timing.instrument(session, pytestconfig.http_calls)
+
+    from token_cache import RefreshOnForbidden, TokenCache
 
-    auth_response = session.post(f"{BASE_URL}/auth", json={"username": "admin", "password": "password123"})
-    assert auth_response.status_code == 200, "Ошибка авторизации, статус код не 200"
-    token = auth_response.json().get("token")
-    assert token is not None, "Токен не найден в ответе"
+    token_cache = TokenCache(constant.BASE_URL, "admin", "password123")
+    token = token_cache.get(session)
+    assert token is not None, "Ошибка авторизации, токен не получен"
 
     session.headers.update({"Cookie": f"token={token}"})
-    return session
+    session.hooks["response"].append(RefreshOnForbidden(session, token_cache, token))
+    tracker = BookingTracker()
+    session.hooks["response"].append(tracker)
+    yield session
+    tracker.cleanup(session)
+    session.close()
+
+
+if pytest_asyncio is not None:
+    @pytest_asyncio.fixture()
+    async def async_booking_client():
+        """
+        Создаёт авторизованный асинхронный клиент с пулом соединений.
+
+        После теста удаляются все бронирования, созданные через клиент и не удалённые тестом
+        (например, если проверка упала посреди жизненного цикла).
+        """
+        from async_client import AsyncBookingClient
+
+        async with AsyncBookingClient(constant.BASE_URL) as client:
+            auth_response = await client.auth()
+            assert auth_response.status == 200, "Ошибка авторизации, статус код не 200"
+            assert client.token is not None, "Токен не найден в ответе"
+            yield client
+            await asyncio.gather(*(client.delete_booking(booking_id) for booking_id in list(client.booking_ids)),
+                                 return_exceptions=True)
+
+    @pytest_asyncio.fixture()
+    async def booking_seeder(async_booking_client):
+        """Отдаёт BookingSeeder; все бронирования, созданные через него, удаляются после теста."""
+        from seeding import BookingSeeder
+
+        async with BookingSeeder(async_booking_client) as seeder:
+            yield seeder
+
+
+@pytest.fixture(scope="session")
+def session_booking_factory():
+    """Генератор с пулами имён, заполняемыми один раз за сессию (воркер xdist)."""
+    from payloads import BookingFactory
+
+    return BookingFactory(int(os.environ["BOOKER_SEED"]), lastname_suffix=namespaced(""))
+
 
 @pytest.fixture()
-def booking_data():
-    return {
-        "firstname": fake.first_name(),
-        "lastname": fake.last_name(),
-        "totalprice": fake.random_int(min=100, max=10000),
-        "depositpaid": True,
-        "bookingdates": {
-            "checkin": "2024-04-05",
-            "checkout": "2024-04-08"
-        },
-        "additionalneeds": "Breakfast"
-    }
+def booking_factory(session_booking_factory, request):
+    """
+    Генератор данных бронирований для теста.
+
+    Последовательность определяется BOOKER_SEED и nodeid теста, поэтому данные теста
+    воспроизводятся независимо от порядка запуска и распределения тестов по воркерам xdist.
+    """
+    return session_booking_factory.derive(request.node.nodeid)
+
+
+@pytest.fixture()
+def booking_data(booking_factory):
+    return booking_factory.one()
 
 @pytest.fixture()
 def booking_data_change():
     return {"firstname": "Никита",
-        "lastname": "Стар",
+        "lastname": namespaced("Стар"),
         "totalprice": 999,
         "depositpaid": True,
         "bookingdates": {
@@ -49,4 +211,4 @@ def booking_data_change():
 @pytest.fixture()
 def booking_data_patch():
     return {"firstname": "Richard",
-        "lastname": "Gentle"}
\ No newline at end of file
+        "lastname": namespaced("Gentle")}
\ No newline at end of file
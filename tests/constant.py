@@ -1,2 +1,7 @@
-BASE_URL = "https://restful-booker.herokuapp.com"
-HEADERS = {"Content-Type": "application/json", "Accept": "application/json"}
\ No newline at end of file
+import os
+
+# Адрес API можно переопределить переменной окружения BOOKER_BASE_URL.
+# Значение "fake" поднимает локальную замену restful-booker (см. fake_booker.py).
+FAKE_BASE_URL = "fake"
+BASE_URL = os.getenv("BOOKER_BASE_URL", "https://restful-booker.herokuapp.com")
+HEADERS = {"Content-Type": "application/json", "Accept": "application/json"}
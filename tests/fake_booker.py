@@ -0,0 +1,331 @@
+import itertools
+import json
+import secrets
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlsplit
+
+USERNAME = "admin"
+PASSWORD = "password123"
+# Basic-авторизация admin:password123, которую restful-booker принимает наравне с токеном
+BASIC_AUTH = "Basic YWRtaW46cGFzc3dvcmQxMjM="
+
+REQUIRED_FIELDS = ("firstname", "lastname", "totalprice", "depositpaid", "bookingdates")
+FIELD_TYPES = {
+    "firstname": str,
+    "lastname": str,
+    "totalprice": int,
+    "depositpaid": bool,
+    "bookingdates": dict,
+    "additionalneeds": str,
+}
+
+
+class BookingStore:
+    """
+    Потокобезопасное хранилище бронирований и выданных токенов.
+
+    Атрибуты:
+        bookings (dict): Бронирования по их ID.
+        tokens (set): Токены, выданные через /auth.
+    """
+    def __init__(self) -> None:
+        self.bookings = {}
+        self.tokens = set()
+        self.lock = threading.Lock()
+        self._ids = itertools.count(1)
+
+    def issue_token(self) -> str:
+        """Выдаёт новый токен и запоминает его."""
+        token = secrets.token_hex(8)
+        with self.lock:
+            self.tokens.add(token)
+        return token
+
+    def create(self, booking: dict) -> int:
+        """Сохраняет бронирование и возвращает присвоенный ему ID."""
+        with self.lock:
+            booking_id = next(self._ids)
+            self.bookings[booking_id] = booking
+        return booking_id
+
+    def search(self, filters: dict) -> list:
+        """Возвращает ID бронирований, подходящих под фильтры firstname/lastname/checkin/checkout."""
+        with self.lock:
+            items = list(self.bookings.items())
+        result = []
+        for booking_id, booking in items:
+            if "firstname" in filters and booking["firstname"] != filters["firstname"]:
+                continue
+            if "lastname" in filters and booking["lastname"] != filters["lastname"]:
+                continue
+            if "checkin" in filters and booking["bookingdates"]["checkin"] < filters["checkin"]:
+                continue
+            if "checkout" in filters and booking["bookingdates"]["checkout"] > filters["checkout"]:
+                continue
+            result.append(booking_id)
+        return result
+
+
+def has_valid_types(payload: dict) -> bool:
+    """Проверяет типы известных полей бронирования (bool не считается int)."""
+    for field, expected in FIELD_TYPES.items():
+        if field not in payload:
+            continue
+        value = payload[field]
+        if expected is int and isinstance(value, bool):
+            return False
+        if not isinstance(value, expected):
+            return False
+    dates = payload.get("bookingdates", {"checkin": "", "checkout": ""})
+    return isinstance(dates.get("checkin"), str) and isinstance(dates.get("checkout"), str)
+
+
+def normalize(payload: dict) -> dict:
+    """Оставляет только поля бронирования в том порядке, в котором их отдаёт restful-booker."""
+    booking = {field: payload[field] for field in FIELD_TYPES if field in payload}
+    booking["bookingdates"] = {
+        "checkin": booking["bookingdates"]["checkin"],
+        "checkout": booking["bookingdates"]["checkout"],
+    }
+    return booking
+
+
+class BookerHandler(BaseHTTPRequestHandler):
+    """
+    Обработчик запросов, повторяющий поведение restful-booker.
+
+    Поддерживает /ping, /auth, а также GET/POST на /booking и GET/PUT/PATCH/DELETE на /booking/{id}.
+    Соединения держатся открытыми (HTTP/1.1 keep-alive).
+    """
+    protocol_version = "HTTP/1.1"
+    server_version = "FakeBooker/1.0"
+    # Заголовки и тело пишутся отдельно; без TCP_NODELAY тело ждёт отложенного ACK клиента
+    disable_nagle_algorithm = True
+
+    @property
+    def store(self) -> BookingStore:
+        return self.server.store
+
+    def log_message(self, format, *args) -> None:
+        """Отключает вывод каждого запроса в stderr."""
+
+    def send_json(self, status: int, body) -> None:
+        """Отправляет ответ с JSON-телом."""
+        self.send_body(status, json.dumps(body).encode(), "application/json; charset=utf-8")
+
+    def send_text(self, status: int, text: str) -> None:
+        """Отправляет текстовый ответ (так restful-booker отвечает на ошибки и DELETE)."""
+        self.send_body(status, text.encode(), "text/plain; charset=utf-8")
+
+    def send_body(self, status: int, data: bytes, content_type: str) -> None:
+        self.send_response(status)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def read_json(self):
+        """Читает тело запроса как JSON. Возвращает None, если тело не разбирается."""
+        length = int(self.headers.get("Content-Length") or 0)
+        raw = self.rfile.read(length) if length else b""
+        if not raw:
+            return {}
+        try:
+            return json.loads(raw)
+        except ValueError:
+            return None
+
+    def is_authorized(self) -> bool:
+        """Проверяет токен из Cookie или Basic-авторизацию."""
+        if self.headers.get("Authorization") == BASIC_AUTH:
+            return True
+        for part in (self.headers.get("Cookie") or "").split(";"):
+            name, _, value = part.strip().partition("=")
+            if name == "token" and value in self.store.tokens:
+                return True
+        return False
+
+    def route(self):
+        """Разбирает путь. Возвращает (ресурс, booking_id или None, параметры запроса)."""
+        url = urlsplit(self.path)
+        parts = [p for p in url.path.split("/") if p]
+        query = {key: values[0] for key, values in parse_qs(url.query).items()}
+        if not parts:
+            return None, None, query
+        booking_id = None
+        if len(parts) == 2 and parts[1].isdigit():
+            booking_id = int(parts[1])
+        elif len(parts) != 1:
+            return None, None, query
+        return parts[0], booking_id, query
+
+    def do_GET(self) -> None:
+        resource, booking_id, query = self.route()
+        if resource == "ping":
+            return self.send_text(201, "Created")
+        if resource != "booking":
+            return self.send_text(404, "Not Found")
+        if booking_id is None:
+            return self.send_json(200, [{"bookingid": i} for i in self.store.search(query)])
+        booking = self.store.bookings.get(booking_id)
+        if booking is None:
+            return self.send_text(404, "Not Found")
+        self.send_json(200, booking)
+
+    def do_POST(self) -> None:
+        resource, booking_id, _ = self.route()
+        payload = self.read_json()
+        if resource == "auth" and booking_id is None:
+            payload = payload or {}
+            if payload.get("username") == USERNAME and payload.get("password") == PASSWORD:
+                return self.send_json(200, {"token": self.store.issue_token()})
+            return self.send_json(200, {"reason": "Bad credentials"})
+        if resource != "booking" or booking_id is not None:
+            return self.send_text(404, "Not Found")
+        if not isinstance(payload, dict) or any(f not in payload for f in REQUIRED_FIELDS) \
+                or not has_valid_types(payload):
+            return self.send_text(500, "Internal Server Error")
+        booking = normalize(payload)
+        self.send_json(200, {"bookingid": self.store.create(booking), "booking": booking})
+
+    def do_PUT(self) -> None:
+        resource, booking_id, _ = self.route()
+        if resource != "booking" or booking_id is None:
+            return self.send_text(404, "Not Found")
+        payload = self.read_json()
+        if not self.is_authorized():
+            return self.send_text(403, "Forbidden")
+        if not isinstance(payload, dict) or any(f not in payload for f in REQUIRED_FIELDS):
+            return self.send_text(400, "Bad Request")
+        if not has_valid_types(payload):
+            return self.send_text(500, "Internal Server Error")
+        booking = normalize(payload)
+        with self.store.lock:
+            if booking_id not in self.store.bookings:
+                return self.send_text(405, "Method Not Allowed")
+            self.store.bookings[booking_id] = booking
+        self.send_json(200, booking)
+
+    def do_PATCH(self) -> None:
+        resource, booking_id, _ = self.route()
+        if resource != "booking" or booking_id is None:
+            return self.send_text(404, "Not Found")
+        payload = self.read_json()
+        if not self.is_authorized():
+            return self.send_text(403, "Forbidden")
+        if not isinstance(payload, dict) or not has_valid_types(payload):
+            return self.send_text(500, "Internal Server Error")
+        with self.store.lock:
+            current = self.store.bookings.get(booking_id)
+            if current is None:
+                return self.send_text(405, "Method Not Allowed")
+            booking = normalize({**current, **payload})
+            self.store.bookings[booking_id] = booking
+        self.send_json(200, booking)
+
+    def do_DELETE(self) -> None:
+        resource, booking_id, _ = self.route()
+        if resource != "booking" or booking_id is None:
+            return self.send_text(404, "Not Found")
+        if not self.is_authorized():
+            return self.send_text(403, "Forbidden")
+        with self.store.lock:
+            if self.store.bookings.pop(booking_id, None) is None:
+                return self.send_text(405, "Method Not Allowed")
+        self.send_text(201, "Created")
+
+
+class BookerServer(ThreadingHTTPServer):
+    """HTTP сервер с увеличенной очередью подключений для сотен одновременных клиентов."""
+    daemon_threads = True
+    request_queue_size = 1024
+
+
+class FakeBooker:
+    """
+    Локальная замена restful-booker, работающая в фоновом потоке текущего процесса.
+
+    Атрибуты:
+        store (BookingStore): Хранилище бронирований сервера.
+        base_url (str): Адрес сервера, подставляемый вместо BASE_URL.
+    """
+    def __init__(self, host: str = "127.0.0.1", port: int = 0) -> None:
+        """
+        Создаёт сервер. Порт 0 означает, что свободный порт выберет ОС.
+
+        Args:
+            host (str, optional): Адрес для прослушивания.
+            port (int, optional): Порт для прослушивания.
+        """
+        self._server = BookerServer((host, port), BookerHandler)
+        self._server.store = self.store = BookingStore()
+        self._thread = None
+        host, port = self._server.server_address[:2]
+        self.base_url = f"http://{host}:{port}"
+
+    def start(self) -> "FakeBooker":
+        """Запускает обработку запросов в фоновом потоке."""
+        # Короткий интервал опроса: иначе stop() ждёт до 0.5 с, пока serve_forever заметит shutdown
+        self._thread = threading.Thread(target=self._server.serve_forever, kwargs={"poll_interval": 0.01},
+                                        name="fake-booker", daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        """Останавливает сервер и освобождает порт."""
+        if self._thread is not None:
+            self._server.shutdown()
+            self._thread.join()
+            self._thread = None
+        self._server.server_close()
+
+    def serve_forever(self) -> None:
+        """Обрабатывает запросы в текущем потоке до остановки сервера."""
+        self._server.serve_forever()
+
+    def __enter__(self) -> "FakeBooker":
+        return self.start()
+
+    def __exit__(self, *exc_info) -> None:
+        self.stop()
+
+
+def test_fake_booker_statuses() -> None:
+    """
+    Проверяет коды ответов локального сервера, на которые опираются тесты TestBookings.
+    """
+    import requests
+
+    with FakeBooker() as server:
+        session = requests.Session()
+        assert session.post(f"{server.base_url}/auth", json={"username": "admin", "password": "x"}).json() == {
+            "reason": "Bad credentials"}
+        created = session.post(f"{server.base_url}/booking", json={
+            "firstname": "Jim", "lastname": "Brown", "totalprice": 111, "depositpaid": True,
+            "bookingdates": {"checkin": "2018-01-01", "checkout": "2019-01-01"}})
+        assert created.status_code == 200
+        booking_id = created.json()["bookingid"]
+        assert session.delete(f"{server.base_url}/booking/{booking_id}").status_code == 403
+        assert session.post(f"{server.base_url}/booking", json={"firstname": "Jim"}).status_code == 500
+        token = session.post(f"{server.base_url}/auth", json={"username": USERNAME, "password": PASSWORD}).json()["token"]
+        session.headers.update({"Cookie": f"token={token}"})
+        assert session.get(f"{server.base_url}/booking?firstname=Jim&lastname=Brown").json() == [
+            {"bookingid": booking_id}]
+        assert session.delete(f"{server.base_url}/booking/{booking_id}").status_code == 201
+        assert session.delete(f"{server.base_url}/booking/{booking_id}").status_code == 405
+
+
+if __name__ == "__main__":
+    import argparse
+
+    arg_parser = argparse.ArgumentParser(description="Локальная замена restful-booker")
+    arg_parser.add_argument("--host", default="127.0.0.1")
+    arg_parser.add_argument("--port", type=int, default=3001)
+    args = arg_parser.parse_args()
+    server = FakeBooker(args.host, args.port)
+    print(f"Fake restful-booker: {server.base_url}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        server.stop()
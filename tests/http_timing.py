@@ -0,0 +1,179 @@
+import json
+import os
+import re
+import threading
+import time
+from collections import defaultdict
+from dataclasses import asdict, dataclass
+from urllib.parse import urlsplit
+
+from requests.adapters import HTTPAdapter
+from urllib3.connection import HTTPConnection, HTTPSConnection
+from urllib3.connectionpool import HTTPConnectionPool, HTTPSConnectionPool
+
+# Время установки соединений, накопленное в текущем потоке за время одного запроса
+_connect_time = threading.local()
+
+
+def endpoint_template(url: str) -> str:
+    """
+    Превращает URL в шаблон эндпоинта: числовые сегменты пути заменяются на {id}.
+
+    Например, https://host/booking/42 -> /booking/{id}.
+    """
+    path = urlsplit(url).path.rstrip("/") or "/"
+    return re.sub(r"/\d+(?=/|$)", "/{id}", path)
+
+
+class TimedHTTPConnection(HTTPConnection):
+    """HTTP соединение urllib3, замеряющее время connect()."""
+    def connect(self) -> None:
+        started = time.perf_counter()
+        super().connect()
+        _connect_time.value = getattr(_connect_time, "value", 0.0) + time.perf_counter() - started
+
+
+class TimedHTTPSConnection(HTTPSConnection):
+    """HTTPS соединение urllib3, замеряющее время connect() вместе с TLS рукопожатием."""
+    def connect(self) -> None:
+        started = time.perf_counter()
+        super().connect()
+        _connect_time.value = getattr(_connect_time, "value", 0.0) + time.perf_counter() - started
+
+
+class TimedHTTPConnectionPool(HTTPConnectionPool):
+    ConnectionCls = TimedHTTPConnection
+
+
+class TimedHTTPSConnectionPool(HTTPSConnectionPool):
+    ConnectionCls = TimedHTTPSConnection
+
+
+@dataclass
+class CallTiming:
+    """
+    Замер одного HTTP вызова.
+
+    Атрибуты:
+        method (str): HTTP метод.
+        endpoint (str): Шаблон эндпоинта, например /booking/{id}.
+        status (int): HTTP статус ответа.
+        bytes (int): Размер тела ответа.
+        connect_ms (float): Время установки соединения (0, если соединение взято из пула).
+        ttfb_ms (float): Время до получения заголовков ответа.
+        total_ms (float): Полное время вызова, включая чтение тела.
+        test (str): Тест, во время которого был сделан вызов.
+    """
+    method: str
+    endpoint: str
+    status: int
+    bytes: int
+    connect_ms: float
+    ttfb_ms: float
+    total_ms: float
+    test: str
+
+
+class TimingAdapter(HTTPAdapter):
+    """
+    Транспорт requests, записывающий CallTiming для каждого запроса.
+
+    Атрибуты:
+        calls (list): Список записанных замеров.
+    """
+    def __init__(self, calls: list, **kwargs) -> None:
+        self.calls = calls
+        super().__init__(**kwargs)
+
+    def init_poolmanager(self, *args, **kwargs) -> None:
+        super().init_poolmanager(*args, **kwargs)
+        self.poolmanager.pool_classes_by_scheme = {"http": TimedHTTPConnectionPool,
+                                                   "https": TimedHTTPSConnectionPool}
+
+    def send(self, request, stream=False, **kwargs):
+        _connect_time.value = 0.0
+        started = time.perf_counter()
+        response = super().send(request, stream=stream, **kwargs)
+        ttfb = time.perf_counter() - started
+        size = 0
+        if not stream:
+            # Тело читается здесь, а не в Session.send, чтобы в total попало время его загрузки
+            size = len(response.content)
+        total = time.perf_counter() - started
+        test = os.environ.get("PYTEST_CURRENT_TEST", "").rsplit(" ", 1)[0]
+        self.calls.append(CallTiming(request.method, endpoint_template(request.url), response.status_code, size,
+                                     round(_connect_time.value * 1000, 3), round(ttfb * 1000, 3),
+                                     round(total * 1000, 3), test))
+        return response
+
+
+def instrument(session, calls: list) -> None:
+    """Подключает к сессии requests транспорт с замером времени всех запросов."""
+    adapter = TimingAdapter(calls)
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+
+
+def aggregate(calls: list) -> list:
+    """Возвращает статистику по каждой паре (метод, эндпоинт), отсортированную по суммарному времени."""
+    groups = defaultdict(list)
+    for call in calls:
+        groups[(call.method, call.endpoint)].append(call)
+    rows = []
+    for (method, endpoint), items in groups.items():
+        totals = [call.total_ms for call in items]
+        rows.append({
+            "method": method,
+            "endpoint": endpoint,
+            "count": len(items),
+            "sum_ms": round(sum(totals), 3),
+            "mean_ms": round(sum(totals) / len(items), 3),
+            "max_ms": max(totals),
+            "mean_connect_ms": round(sum(call.connect_ms for call in items) / len(items), 3),
+            "mean_ttfb_ms": round(sum(call.ttfb_ms for call in items) / len(items), 3),
+            "bytes": sum(call.bytes for call in items),
+        })
+    return sorted(rows, key=lambda row: row["sum_ms"], reverse=True)
+
+
+def write_report(terminal, calls: list, slowest: int = 10) -> None:
+    """Печатает в терминал pytest самые медленные вызовы и статистику по эндпоинтам."""
+    terminal.write_sep("=", f"slowest {min(slowest, len(calls))} HTTP calls")
+    for call in sorted(calls, key=lambda call: call.total_ms, reverse=True)[:slowest]:
+        terminal.write_line(f"{call.total_ms:9.2f} ms  {call.method:<6} {call.endpoint:<16} {call.status}  "
+                            f"connect {call.connect_ms:.2f} ms, ttfb {call.ttfb_ms:.2f} ms, {call.bytes} B  "
+                            f"{call.test}")
+    terminal.write_sep("-", "HTTP calls per endpoint")
+    for row in aggregate(calls):
+        terminal.write_line(f"{row['method']:<6} {row['endpoint']:<16} count {row['count']:<5} "
+                            f"sum {row['sum_ms']:.2f} ms, mean {row['mean_ms']:.2f} ms, max {row['max_ms']:.2f} ms, "
+                            f"connect {row['mean_connect_ms']:.2f} ms, ttfb {row['mean_ttfb_ms']:.2f} ms, "
+                            f"{row['bytes']} B")
+
+
+def dump_json(path: str, calls: list) -> None:
+    """Сохраняет все замеры и агрегаты в JSON файл."""
+    with open(path, "w", encoding="utf-8") as file:
+        json.dump({"calls": [asdict(call) for call in calls], "endpoints": aggregate(calls)},
+                  file, ensure_ascii=False, indent=2)
+
+
+def test_timing_adapter_records_calls() -> None:
+    """
+    Проверяет, что адаптер записывает шаблон эндпоинта, статус, размер и время каждого вызова.
+    """
+    import requests
+    from fake_booker import FakeBooker
+
+    calls = []
+    with FakeBooker() as server:
+        session = requests.Session()
+        instrument(session, calls)
+        session.get(f"{server.base_url}/booking/1")
+        session.get(f"{server.base_url}/booking")
+    first, second = calls
+    assert (first.method, first.endpoint, first.status, first.bytes) == ("GET", "/booking/{id}", 404, 9)
+    assert second.endpoint == "/booking" and second.status == 200
+    assert first.connect_ms > 0 and second.connect_ms == 0, "второй вызов должен идти по keep-alive"
+    assert 0 < first.ttfb_ms <= first.total_ms
+    assert [row["count"] for row in aggregate(calls)] == [1, 1]
@@ -0,0 +1,255 @@
+import json
+import mmap
+import os
+import struct
+from typing import Iterator
+
+from oop_practic import BankAccount, CheckingAccount, SavingsAccount
+
+OPEN, DEPOSIT, WITHDRAW, INTEREST = 1, 2, 3, 4
+ACCOUNT_TYPES = (BankAccount, SavingsAccount, CheckingAccount)
+
+MAGIC = b"BKJ1"
+# Заголовок: сигнатура, версия формата, число записей
+HEADER = struct.Struct("<4sIQ")
+# Запись: номер, сумма, ID счета, тип события, тип счета (для OPEN)
+RECORD = struct.Struct("<QdIBB2x")
+INITIAL_CAPACITY = 1 << 16
+
+
+class Journal:
+    """
+    Журнал событий счетов: бинарный файл только для дописывания, отображённый в память (mmap).
+
+    Записи фиксированного размера, поэтому запись с номером N лежит по смещению
+    HEADER.size + N * RECORD.size и чтение хвоста не требует просмотра начала журнала.
+    Запись попадает в страничный кэш ОС сразу, так что падение процесса её не теряет;
+    flush() дополнительно сбрасывает данные на диск.
+
+    Атрибуты:
+        path (str): Путь к файлу журнала.
+        count (int): Число записей в журнале.
+    """
+    def __init__(self, path: str) -> None:
+        self.path = path
+        exists = os.path.exists(path) and os.path.getsize(path) >= HEADER.size
+        self._file = open(path, "r+b" if exists else "w+b")
+        if not exists:
+            self._file.truncate(HEADER.size + INITIAL_CAPACITY * RECORD.size)
+        self._map = mmap.mmap(self._file.fileno(), 0)
+        if exists:
+            magic, version, self.count = HEADER.unpack_from(self._map, 0)
+            if magic != MAGIC:
+                raise ValueError(f"{path} не является журналом счетов")
+        else:
+            self.count = 0
+            HEADER.pack_into(self._map, 0, MAGIC, 1, 0)
+
+    def _grow(self) -> None:
+        """Удваивает размер файла и заново отображает его в память."""
+        size = len(self._map)
+        self._map.close()
+        self._file.truncate(HEADER.size + 2 * (size - HEADER.size))
+        self._map = mmap.mmap(self._file.fileno(), 0)
+
+    def append(self, kind: int, account: int, amount: float, account_type: int = 0) -> int:
+        """
+        Дописывает событие в конец журнала и возвращает его номер.
+
+        Счётчик в заголовке обновляется после записи, поэтому недописанная запись не будет прочитана.
+        """
+        offset = HEADER.size + self.count * RECORD.size
+        if offset + RECORD.size > len(self._map):
+            self._grow()
+        RECORD.pack_into(self._map, offset, self.count, amount, account, kind, account_type)
+        self.count += 1
+        struct.pack_into("<Q", self._map, 8, self.count)
+        return self.count - 1
+
+    def records(self, start: int = 0) -> Iterator[tuple]:
+        """Отдаёт записи (номер, сумма, ID счета, тип события, тип счета), начиная с номера start."""
+        return RECORD.iter_unpack(self._map[HEADER.size + start * RECORD.size:HEADER.size + self.count * RECORD.size])
+
+    def flush(self) -> None:
+        """Сбрасывает отображённые страницы на диск."""
+        self._map.flush()
+
+    def close(self) -> None:
+        self._map.flush()
+        self._map.close()
+        self._file.close()
+
+
+class JournaledBank:
+    """
+    Набор счетов, все операции над которыми записываются в журнал.
+
+    Состояние периодически сохраняется в снимок. При открытии загружается последний снимок
+    и из журнала воспроизводятся только события после него, поэтому время восстановления
+    ограничено snapshot_every событиями, сколько бы ни было истории.
+
+    Атрибуты:
+        accounts (dict): Счета по ID.
+        snapshot_every (int): Через сколько событий делать снимок автоматически.
+        replayed (int): Сколько событий журнала было воспроизведено при открытии.
+    """
+    def __init__(self, directory: str, snapshot_every: int = 100_000) -> None:
+        os.makedirs(directory, exist_ok=True)
+        self.accounts = {}
+        self.snapshot_every = snapshot_every
+        self._snapshot_path = os.path.join(directory, "snapshot.json")
+        self._owners_path = os.path.join(directory, "owners.jsonl")
+        self._journal = Journal(os.path.join(directory, "journal.bin"))
+        self._snapshot_seq = 0
+        self.replayed = self._recover()
+        self._owners = open(self._owners_path, "a", encoding="utf-8")
+
+    def _recover(self) -> int:
+        """Загружает снимок и воспроизводит хвост журнала. Возвращает число воспроизведённых событий."""
+        if os.path.exists(self._snapshot_path):
+            with open(self._snapshot_path, encoding="utf-8") as file:
+                snapshot = json.load(file)
+            self._snapshot_seq = snapshot["seq"]
+            for account_id, account_type, owner, balance in snapshot["accounts"]:
+                self.accounts[account_id] = ACCOUNT_TYPES[account_type](owner, balance)
+        owners = {}
+        if os.path.exists(self._owners_path):
+            with open(self._owners_path, encoding="utf-8") as file:
+                for line in file:
+                    entry = json.loads(line)
+                    owners[entry["id"]] = entry["owner"]
+        replayed = 0
+        for _, amount, account_id, kind, account_type in self._journal.records(self._snapshot_seq):
+            if kind == OPEN:
+                self.accounts[account_id] = ACCOUNT_TYPES[account_type](owners.get(account_id, ""), amount)
+            elif kind == DEPOSIT:
+                self.accounts[account_id].deposit(amount)
+            elif kind == WITHDRAW:
+                self.accounts[account_id].withdraw(amount)
+            elif kind == INTEREST:
+                # Ставка берётся из записи: interest_rate с тех пор мог измениться
+                account = self.accounts[account_id]
+                account._BankAccount__balance = account.get_balance() * (1 + amount)
+            replayed += 1
+        return replayed
+
+    def _record(self, kind: int, account_id: int, amount: float, account_type: int = 0) -> None:
+        self._journal.append(kind, account_id, amount, account_type)
+        if self._journal.count - self._snapshot_seq >= self.snapshot_every:
+            self.snapshot()
+
+    def open_account(self, owner: str, balance: float = 0, kind: type = BankAccount) -> int:
+        """Открывает счет и возвращает его ID."""
+        account_id = len(self.accounts)
+        self.accounts[account_id] = kind(owner, balance)
+        self._owners.write(json.dumps({"id": account_id, "owner": owner}, ensure_ascii=False) + "\n")
+        self._owners.flush()
+        self._record(OPEN, account_id, balance, ACCOUNT_TYPES.index(kind))
+        return account_id
+
+    def deposit(self, account_id: int, amount: float) -> None:
+        """Вносит депозит на счет (проверки — как в BankAccount.deposit) и записывает событие."""
+        self.accounts[account_id].deposit(amount)
+        self._record(DEPOSIT, account_id, amount)
+
+    def withdraw(self, account_id: int, amount: float) -> None:
+        """Снимает сумму со счета (проверки — как в withdraw типа счета) и записывает событие."""
+        self.accounts[account_id].withdraw(amount)
+        self._record(WITHDRAW, account_id, amount)
+
+    def apply_interest(self, account_id: int) -> None:
+        """Начисляет проценты на сберегательный счет и записывает событие."""
+        account = self.accounts[account_id]
+        account.apply_interest()
+        self._record(INTEREST, account_id, account.interest_rate)
+
+    def get_balance(self, account_id: int) -> float:
+        return self.accounts[account_id].get_balance()
+
+    def snapshot(self) -> None:
+        """Атомарно сохраняет балансы всех счетов вместе с номером последнего учтённого события."""
+        self._journal.flush()
+        accounts = [[account_id, ACCOUNT_TYPES.index(type(account)), account.owner, account.get_balance()]
+                    for account_id, account in self.accounts.items()]
+        tmp_path = f"{self._snapshot_path}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as file:
+            json.dump({"seq": self._journal.count, "accounts": accounts}, file, ensure_ascii=False)
+            file.flush()
+            os.fsync(file.fileno())
+        os.replace(tmp_path, self._snapshot_path)
+        self._snapshot_seq = self._journal.count
+
+    def close(self) -> None:
+        self._owners.close()
+        self._journal.close()
+
+
+def test_journal_recovery(tmp_path) -> None:
+    """
+    Проверяет, что после перезапуска балансы восстанавливаются из снимка и хвоста журнала.
+    """
+    bank = JournaledBank(str(tmp_path), snapshot_every=1000)
+    savings = bank.open_account("Никита", 0, SavingsAccount)
+    checking = bank.open_account("Никита", 10, CheckingAccount)
+    for _ in range(700):
+        bank.deposit(savings, 500)
+        bank.withdraw(savings, 100)
+        bank.withdraw(checking, 0.1)
+    bank.apply_interest(savings)
+    expected = {account_id: bank.get_balance(account_id) for account_id in bank.accounts}
+    # Падение процесса: журнал и файл владельцев не закрываются
+    del bank
+
+    recovered = JournaledBank(str(tmp_path), snapshot_every=1000)
+    assert {account_id: recovered.get_balance(account_id) for account_id in recovered.accounts} == expected
+    assert recovered.accounts[checking].owner == "Никита"
+    assert recovered.replayed == 2103 - 2000, "должен воспроизводиться только хвост после снимка"
+    recovered.close()
+
+
+def test_journal_replays_logged_interest_rate(tmp_path, monkeypatch) -> None:
+    """
+    Проверяет, что проценты воспроизводятся по ставке из журнала, а не по текущей interest_rate.
+    """
+    monkeypatch.setattr(SavingsAccount, "interest_rate", 0.1)
+    bank = JournaledBank(str(tmp_path))
+    savings = bank.open_account("Никита", 1000, SavingsAccount)
+    bank.apply_interest(savings)
+    bank.close()
+    monkeypatch.undo()
+
+    recovered = JournaledBank(str(tmp_path))
+    assert recovered.get_balance(savings) == 1000 * 1.1
+    recovered.close()
+
+
+if __name__ == "__main__":
+    import sys
+    import tempfile
+    import time
+
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+    with tempfile.TemporaryDirectory() as directory:
+        bank = JournaledBank(directory, snapshot_every=100_000)
+        ids = [bank.open_account(f"owner-{i}", 1000, SavingsAccount) for i in range(1000)]
+        started = time.perf_counter()
+        for i in range(n):
+            bank.deposit(ids[i % 1000], 10)
+        append_time = time.perf_counter() - started
+        bank.close()
+
+        started = time.perf_counter()
+        recovered = JournaledBank(directory, snapshot_every=100_000)
+        recover_time = time.perf_counter() - started
+        replayed = recovered.replayed
+        recovered.close()
+        os.remove(os.path.join(directory, "snapshot.json"))
+
+        started = time.perf_counter()
+        full = JournaledBank(directory)
+        full_time = time.perf_counter() - started
+        full.close()
+
+    print(f"{n} событий: запись {append_time:.3f} с ({n / append_time:,.0f} событий/с)")
+    print(f"восстановление со снимком: {recover_time:.3f} с ({replayed} событий из хвоста)")
+    print(f"восстановление без снимка: {full_time:.3f} с ({full.replayed} событий)")
@@ -0,0 +1,267 @@
+from typing import Iterable, Optional
+
+import numpy as np
+
+from oop_practic import BankAccount, CheckingAccount, SavingsAccount
+
+# Балансы хранятся в копейках: 1 единица счета = SCALE целых единиц
+SCALE = 100
+KINDS = (BankAccount, SavingsAccount, CheckingAccount)
+
+
+def to_units(amount: float) -> int:
+    """Переводит сумму в целые копейки с округлением."""
+    return int(round(amount * SCALE))
+
+
+class Ledger:
+    """
+    Реестр счетов, хранящий балансы в непрерывных массивах целых копеек.
+
+    Каждый счет — это индекс в массивах, а не отдельный объект, поэтому миллионы счетов занимают
+    по 9 байт (баланс и тип счета) и обрабатываются пакетно. Проверки и тексты ошибок совпадают
+    с методами BankAccount, SavingsAccount и CheckingAccount.
+
+    Атрибуты:
+        owners (list): Владельцы счетов по индексам.
+    """
+    def __init__(self, capacity: int = 1024) -> None:
+        self.owners = []
+        self._balances = np.zeros(capacity, dtype=np.int64)
+        self._kinds = np.zeros(capacity, dtype=np.int8)
+
+    def __len__(self) -> int:
+        return len(self.owners)
+
+    @property
+    def balances(self) -> np.ndarray:
+        """Балансы всех счетов в копейках (только для чтения)."""
+        view = self._balances[:len(self)]
+        view.flags.writeable = False
+        return view
+
+    def open(self, owner: str, balance: float = 0, kind: type = BankAccount) -> int:
+        """
+        Открывает счет и возвращает его индекс.
+
+        Args:
+            owner (str): Имя владельца счета.
+            balance (float, optional): Начальный баланс счета. По умолчанию 0.
+            kind (type, optional): BankAccount, SavingsAccount или CheckingAccount.
+        """
+        index = len(self.owners)
+        if index == len(self._balances):
+            self._balances = np.resize(self._balances, max(1, 2 * index))
+            self._kinds = np.resize(self._kinds, max(1, 2 * index))
+        self._balances[index] = to_units(balance)
+        self._kinds[index] = KINDS.index(kind)
+        self.owners.append(owner)
+        return index
+
+    def open_many(self, owners: list, balances: Optional[Iterable[float]] = None,
+                  kind: type = BankAccount) -> np.ndarray:
+        """Открывает сразу много счетов одного типа и возвращает их индексы."""
+        start, end = len(self.owners), len(self.owners) + len(owners)
+        if end > len(self._balances):
+            self._balances = np.resize(self._balances, max(end, 2 * len(self._balances)))
+            self._kinds = np.resize(self._kinds, max(end, 2 * len(self._kinds)))
+        values = np.zeros(len(owners)) if balances is None else np.asarray(balances, dtype=np.float64)
+        self._balances[start:end] = np.rint(values * SCALE).astype(np.int64)
+        self._kinds[start:end] = KINDS.index(kind)
+        self.owners.extend(owners)
+        return np.arange(start, end)
+
+    def _check(self, index: int) -> int:
+        """
+        Проверяет, что счет с таким индексом открыт.
+
+        Raises:
+            IndexError: Если индекс вне диапазона открытых счетов.
+        """
+        if not 0 <= index < len(self):
+            raise IndexError(f"Счет {index} не открыт")
+        return index
+
+    def get_balance(self, index: int) -> float:
+        """Возвращает текущий баланс счета."""
+        return int(self._balances[self._check(index)]) / SCALE
+
+    def deposit(self, index: int, amount: float) -> None:
+        """
+        Вносит депозит на счет.
+
+        Raises:
+            IndexError: Если счет не открыт.
+            ValueError: Если сумма депозита не является положительной.
+        """
+        self._check(index)
+        units = to_units(amount)
+        # Проверяется сумма в копейках: 0.001 иначе прошла бы проверку и ничего не зачислила
+        if units <= 0:
+            raise ValueError("Сумма для депозита должна быть положительной!")
+        self._balances[index] += units
+
+    def withdraw(self, index: int, amount: float) -> None:
+        """
+        Снимает сумму со счета. Текущему счету (CheckingAccount) разрешено уходить в минус.
+
+        Raises:
+            IndexError: Если счет не открыт.
+            ValueError: Если сумма для снятия не положительная или если недостаточно средств.
+        """
+        self._check(index)
+        units = to_units(amount)
+        if units <= 0:
+            raise ValueError("Сумма для снятия должна быть положительной!")
+        if KINDS[self._kinds[index]] is not CheckingAccount and units > self._balances[index]:
+            raise ValueError("Недостаточно средств!")
+        self._balances[index] -= units
+
+    def _batch(self, indices, amounts, message: str):
+        """Проверяет пакет операций и возвращает (индексы, суммы в копейках)."""
+        indices = np.asarray(indices, dtype=np.int64)
+        amounts = np.asarray(amounts, dtype=np.float64)
+        if len(indices) and (indices.min() < 0 or indices.max() >= len(self)):
+            bad = indices[(indices < 0) | (indices >= len(self))][0]
+            raise IndexError(f"Счет {bad} не открыт")
+        units = np.rint(amounts * SCALE).astype(np.int64)
+        if (units <= 0).any():
+            raise ValueError(message)
+        return indices, units
+
+    def deposit_many(self, indices, amounts) -> None:
+        """
+        Вносит депозиты на много счетов разом. Пакет применяется целиком или не применяется вовсе.
+
+        Args:
+            indices: Индексы счетов (могут повторяться).
+            amounts: Суммы депозитов.
+
+        Raises:
+            IndexError: Если какой-то счет не открыт.
+            ValueError: Если хотя бы одна сумма не положительная.
+        """
+        indices, units = self._batch(indices, amounts, "Сумма для депозита должна быть положительной!")
+        np.add.at(self._balances, indices, units)
+
+    def withdraw_many(self, indices, amounts) -> None:
+        """
+        Снимает суммы со многих счетов разом. Пакет применяется целиком или не применяется вовсе.
+
+        Raises:
+            IndexError: Если какой-то счет не открыт.
+            ValueError: Если хотя бы одна сумма не положительная или если на каком-то счете,
+                кроме текущих, не хватает средств на все его снятия из пакета.
+        """
+        indices, units = self._batch(indices, amounts, "Сумма для снятия должна быть положительной!")
+        totals = np.zeros(len(self), dtype=np.int64)
+        np.add.at(totals, indices, units)
+        limited = self._kinds[:len(self)] != KINDS.index(CheckingAccount)
+        if (limited & (totals > self._balances[:len(self)])).any():
+            raise ValueError("Недостаточно средств!")
+        np.subtract.at(self._balances, indices, units)
+
+    def apply_interest(self, rate: float = SavingsAccount.interest_rate) -> None:
+        """Начисляет проценты на все сберегательные счета одной векторной операцией."""
+        savings = np.flatnonzero(self._kinds[:len(self)] == KINDS.index(SavingsAccount))
+        balances = self._balances[savings]
+        self._balances[savings] = balances + np.rint(balances * rate).astype(np.int64)
+
+
+def test_ledger_matches_accounts() -> None:
+    """
+    Проверяет, что реестр даёт те же балансы и ошибки, что и классы счетов.
+    """
+    import pytest
+
+    ledger = Ledger(capacity=1)
+    savings = ledger.open("Никита", 0, SavingsAccount)
+    checking = ledger.open("Никита", 0, CheckingAccount)
+    savings_account = SavingsAccount("Никита", 0)
+
+    savings_account.deposit(500)
+    savings_account.withdraw(100)
+    savings_account.apply_interest()
+    ledger.deposit(savings, 500)
+    ledger.withdraw(savings, 100)
+    ledger.apply_interest()
+    assert ledger.get_balance(savings) == savings_account.get_balance()
+
+    with pytest.raises(ValueError, match="Недостаточно средств!"):
+        ledger.withdraw(savings, 1000)
+    with pytest.raises(ValueError, match="Сумма для депозита должна быть положительной!"):
+        ledger.deposit(savings, 0)
+    with pytest.raises(ValueError, match="Сумма для снятия должна быть положительной!"):
+        ledger.withdraw(checking, -5)
+    ledger.withdraw(checking, 50)
+    assert ledger.get_balance(checking) == -50
+
+    others = ledger.open_many(["a", "b", "c"], [10, 20, 30])
+    ledger.deposit_many(np.repeat(others, 2), [1.5] * 6)
+    with pytest.raises(ValueError, match="Недостаточно средств!"):
+        ledger.withdraw_many([others[0], others[0]], [10, 10])
+    with pytest.raises(ValueError, match="Сумма для снятия должна быть положительной!"):
+        ledger.withdraw_many(others, [1, -1, 1])
+    ledger.withdraw_many(others, [13, 1, 1])
+    assert [ledger.get_balance(i) for i in others] == [0, 22, 32]
+
+    with pytest.raises(ValueError, match="Сумма для депозита должна быть положительной!"):
+        ledger.deposit(savings, 0.001)
+    with pytest.raises(ValueError, match="Сумма для снятия должна быть положительной!"):
+        ledger.withdraw(checking, 0.004)
+    with pytest.raises(ValueError, match="Сумма для депозита должна быть положительной!"):
+        ledger.deposit_many(others, [1, 0.001, 1])
+
+    empty = Ledger(capacity=0)
+    assert [empty.open("a", 1), empty.open("b", 2)] == [0, 1]
+    assert empty.get_balance(1) == 2
+
+    for index in (len(ledger), 100, -1):
+        with pytest.raises(IndexError, match=f"Счет {index} не открыт"):
+            ledger.deposit(index, 100)
+        with pytest.raises(IndexError, match=f"Счет {index} не открыт"):
+            ledger.withdraw(index, 1)
+        with pytest.raises(IndexError, match=f"Счет {index} не открыт"):
+            ledger.deposit_many([others[0], index], [1.0, 1.0])
+        with pytest.raises(IndexError, match=f"Счет {index} не открыт"):
+            ledger.withdraw_many([index], [1.0])
+    assert [ledger.get_balance(i) for i in others] == [0, 22, 32]
+
+
+if __name__ == "__main__":
+    import sys
+    import time
+    import tracemalloc
+
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+    owners = [f"owner-{i}" for i in range(n)]
+
+    tracemalloc.start()
+    started = time.perf_counter()
+    accounts = [SavingsAccount(owner, 100) for owner in owners]
+    for account in accounts:
+        account.deposit(50)
+    for account in accounts:
+        account.withdraw(25)
+    for account in accounts:
+        account.apply_interest()
+    objects_time = time.perf_counter() - started
+    objects_memory = tracemalloc.get_traced_memory()[0]
+    del accounts
+    tracemalloc.stop()
+
+    tracemalloc.start()
+    started = time.perf_counter()
+    ledger = Ledger(capacity=n)
+    indices = ledger.open_many(owners, np.full(n, 100.0), SavingsAccount)
+    ledger.deposit_many(indices, np.full(n, 50.0))
+    ledger.withdraw_many(indices, np.full(n, 25.0))
+    ledger.apply_interest()
+    ledger_time = time.perf_counter() - started
+    ledger_memory = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+
+    print(f"{n} счетов: открытие, депозит, снятие, проценты")
+    print(f"объекты SavingsAccount: {objects_time:.3f} с, {objects_memory / 2**20:.1f} МБ")
+    print(f"Ledger:                 {ledger_time:.3f} с, {ledger_memory / 2**20:.1f} МБ")
+    print("(память включает строки владельцев, общие для обоих вариантов)")
@@ -0,0 +1,209 @@
+import argparse
+import asyncio
+import json
+import math
+import time
+from collections import defaultdict
+
+import constant
+from async_api import booking_lifecycle
+from async_client import AsyncBookingClient
+from fake_booker import FakeBooker
+from payloads import BookingFactory
+
+
+def percentile(sorted_values: list, p: float) -> float:
+    """
+    Возвращает перцентиль отсортированного списка методом ближайшего ранга.
+
+    Args:
+        sorted_values (list): Отсортированные значения.
+        p (float): Перцентиль от 0 до 100.
+    """
+    if not sorted_values:
+        return 0.0
+    rank = math.ceil(p / 100 * len(sorted_values)) - 1
+    return sorted_values[min(max(rank, 0), len(sorted_values) - 1)]
+
+
+class LatencyRecorder:
+    """
+    Собирает время ответов, сгруппированное по эндпоинту и статусу.
+
+    Атрибуты:
+        samples (dict): Списки времён ответа в секундах по ключу (метод, шаблон пути, статус).
+    """
+    def __init__(self) -> None:
+        self.samples = defaultdict(list)
+
+    def __call__(self, method: str, endpoint: str, status: int, elapsed: float) -> None:
+        self.samples[(method, endpoint, status)].append(elapsed)
+
+    def summary(self, wall_time: float) -> list:
+        """Возвращает статистику p50/p95/p99 (в мс) и пропускную способность для каждой группы."""
+        rows = []
+        for (method, endpoint, status), values in sorted(self.samples.items()):
+            values = sorted(values)
+            rows.append({
+                "method": method,
+                "endpoint": endpoint,
+                "status": status,
+                "count": len(values),
+                "rps": round(len(values) / wall_time, 2) if wall_time else 0.0,
+                "p50_ms": round(percentile(values, 50) * 1000, 3),
+                "p95_ms": round(percentile(values, 95) * 1000, 3),
+                "p99_ms": round(percentile(values, 99) * 1000, 3),
+                "max_ms": round(values[-1] * 1000, 3),
+            })
+        return rows
+
+
+async def run_load(base_url: str, concurrency: int = 10, rate: float = 0, duration: float = 10,
+                   iterations: int = 0, seed: int = 0) -> dict:
+    """
+    Прогоняет жизненные циклы бронирований из async_api.booking_lifecycle под нагрузкой.
+
+    Args:
+        base_url (str): Адрес API.
+        concurrency (int, optional): Число одновременно выполняемых циклов.
+        rate (float, optional): Сколько циклов запускать в секунду; 0 — без ограничения.
+        duration (float, optional): Длительность прогона в секундах.
+        iterations (int, optional): Если больше 0, прогон останавливается после стольких циклов.
+        seed (int, optional): Зерно генератора данных бронирований.
+
+    Returns:
+        dict: Параметры прогона, итоги и статистика по эндпоинтам.
+    """
+    recorder = LatencyRecorder()
+    started_cycles = 0
+    completed = 0
+    errors = defaultdict(int)
+    payloads = BookingFactory(seed).stream()
+
+    async with AsyncBookingClient(base_url, pool_size=concurrency) as client:
+        auth_response = await client.auth()
+        assert client.token is not None, f"Ошибка авторизации, статус код {auth_response.status}"
+        client.on_response = recorder
+        start = time.perf_counter()
+        deadline = start + duration
+
+        async def worker() -> None:
+            nonlocal started_cycles, completed
+            while True:
+                if iterations and started_cycles >= iterations:
+                    return
+                index = started_cycles
+                started_cycles += 1
+                if rate:
+                    delay = start + index / rate - time.perf_counter()
+                    if delay > 0:
+                        await asyncio.sleep(delay)
+                if time.perf_counter() >= deadline:
+                    return
+                try:
+                    await booking_lifecycle(client, next(payloads))
+                    completed += 1
+                except Exception as error:
+                    errors[type(error).__name__] += 1
+
+        await asyncio.gather(*(worker() for _ in range(concurrency)))
+        wall_time = time.perf_counter() - start
+        # Бронирования циклов, упавших до удаления, не должны оставаться на сервере
+        client.on_response = None
+        await asyncio.gather(*(client.delete_booking(booking_id) for booking_id in list(client.booking_ids)),
+                             return_exceptions=True)
+
+    endpoints = recorder.summary(wall_time)
+    return {
+        "config": {"base_url": base_url, "concurrency": concurrency, "rate": rate,
+                   "duration": duration, "iterations": iterations, "seed": seed},
+        "wall_time_s": round(wall_time, 3),
+        "lifecycles": completed,
+        "errors": dict(errors),
+        "requests": sum(row["count"] for row in endpoints),
+        "rps": round(sum(row["count"] for row in endpoints) / wall_time, 2) if wall_time else 0.0,
+        "endpoints": endpoints,
+    }
+
+
+def print_report(report: dict) -> None:
+    """Печатает отчёт о прогоне в виде таблицы."""
+    print(f"Циклов: {report['lifecycles']}, ошибок: {sum(report['errors'].values())}, "
+          f"запросов: {report['requests']}, {report['rps']} req/s за {report['wall_time_s']} с")
+    print(f"{'endpoint':<24}{'status':>7}{'count':>8}{'rps':>10}{'p50 ms':>10}{'p95 ms':>10}{'p99 ms':>10}")
+    for row in report["endpoints"]:
+        print(f"{row['method'] + ' ' + row['endpoint']:<24}{row['status']:>7}{row['count']:>8}{row['rps']:>10}"
+              f"{row['p50_ms']:>10}{row['p95_ms']:>10}{row['p99_ms']:>10}")
+
+
+def test_percentile_nearest_rank() -> None:
+    """
+    Проверяет перцентили методом ближайшего ранга на известных списках.
+    """
+    values = list(range(1, 101))
+    assert [percentile(values, p) for p in (0, 50, 95, 99, 100)] == [1, 50, 95, 99, 100]
+    assert percentile([1, 2, 3, 4, 5, 6], 50) == 3
+    assert percentile([7], 99) == 7
+    assert percentile([], 50) == 0.0
+
+
+def test_run_load_report() -> None:
+    """
+    Проверяет, что короткий прогон против локального сервера даёт статистику по всем эндпоинтам цикла.
+    """
+    with FakeBooker() as server:
+        report = asyncio.run(run_load(server.base_url, concurrency=5, duration=30, iterations=20))
+    assert report["lifecycles"] == 20
+    assert report["errors"] == {}
+    statuses = {(row["method"], row["endpoint"], row["status"]) for row in report["endpoints"]}
+    assert ("POST", "/booking", 200) in statuses
+    assert ("DELETE", "/booking/{id}", 201) in statuses
+    assert ("GET", "/booking/{id}", 404) in statuses
+    assert all(row["p50_ms"] <= row["p95_ms"] <= row["p99_ms"] for row in report["endpoints"])
+
+
+def test_run_load_deletes_failed_cycles(monkeypatch) -> None:
+    """
+    Проверяет, что бронирования циклов, упавших после создания, удаляются в конце прогона.
+    """
+    import requests
+
+    async def failing_lifecycle(client, booking_data: dict) -> None:
+        await client.create_booking(booking_data)
+        raise AssertionError("цикл упал после создания")
+
+    monkeypatch.setitem(globals(), "booking_lifecycle", failing_lifecycle)
+    with FakeBooker() as server:
+        report = asyncio.run(run_load(server.base_url, concurrency=2, duration=30, iterations=5))
+        remaining = requests.get(f"{server.base_url}/booking").json()
+    assert report["errors"] == {"AssertionError": 5}
+    assert remaining == []
+
+
+def main() -> None:
+    arg_parser = argparse.ArgumentParser(description="Нагрузочный прогон жизненных циклов бронирований")
+    arg_parser.add_argument("--base-url", default=constant.BASE_URL,
+                            help='адрес API; "fake" поднимает локальный restful-booker')
+    arg_parser.add_argument("--concurrency", type=int, default=10)
+    arg_parser.add_argument("--rate", type=float, default=0, help="циклов в секунду, 0 — без ограничения")
+    arg_parser.add_argument("--duration", type=float, default=10, help="длительность в секундах")
+    arg_parser.add_argument("--iterations", type=int, default=0, help="остановиться после N циклов")
+    arg_parser.add_argument("--seed", type=int, default=0, help="зерно генератора данных бронирований")
+    arg_parser.add_argument("--output", help="путь для сохранения результатов в JSON")
+    args = arg_parser.parse_args()
+
+    server = FakeBooker().start() if args.base_url == constant.FAKE_BASE_URL else None
+    try:
+        report = asyncio.run(run_load(server.base_url if server else args.base_url, args.concurrency,
+                                      args.rate, args.duration, args.iterations, args.seed))
+    finally:
+        if server:
+            server.stop()
+    print_report(report)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as file:
+            json.dump(report, file, ensure_ascii=False, indent=2)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,184 @@
+import datetime
+from array import array
+from dataclasses import dataclass
+from typing import Iterable
+
+import numpy as np
+
+from orders import MAX_DURATION
+
+INT_FIELDS = ("brand_id", "count", "completed", "refunded", "wait_refund")
+
+
+def to_utc_naive(value: str) -> str:
+    """
+    Приводит ISO-8601 время к UTC без указания зоны, как того требует datetime64.
+
+    Время с "Z" просто лишается суффикса, остальные форматы разбираются через dateutil.
+    """
+    if value.endswith("Z"):
+        return value[:-1]
+    from dateutil import parser
+
+    parsed = parser.isoparse(value)
+    if parsed.tzinfo is not None:
+        parsed = parsed.astimezone(datetime.timezone.utc).replace(tzinfo=None)
+    return parsed.isoformat()
+
+
+@dataclass
+class OrderColumns:
+    """
+    Заказы в колоночном виде: по массиву NumPy на каждое поле.
+
+    Атрибуты:
+        ids (np.ndarray): ID заказов.
+        brand_id, count, completed, refunded, wait_refund (np.ndarray): Целочисленные поля (int64).
+        started_at, completed_at (np.ndarray): Время начала и завершения (datetime64[us], UTC).
+    """
+    ids: np.ndarray
+    brand_id: np.ndarray
+    count: np.ndarray
+    completed: np.ndarray
+    refunded: np.ndarray
+    wait_refund: np.ndarray
+    started_at: np.ndarray
+    completed_at: np.ndarray
+
+    @classmethod
+    def from_orders(cls, records: Iterable[dict]) -> "OrderColumns":
+        """
+        Собирает колонки из заказов за один проход.
+
+        Args:
+            records (Iterable[dict]): Заказы, например orders["data"] или поток из order_stream.
+        """
+        ints = {field: array("q") for field in INT_FIELDS}
+        ids, started_at, completed_at = [], [], []
+        for order in records:
+            for field, column in ints.items():
+                column.append(order[field])
+            ids.append(order["_id"])
+            started_at.append(to_utc_naive(order["startedAt"]))
+            completed_at.append(to_utc_naive(order["completedAt"]))
+        return cls(
+            ids=np.array(ids, dtype=object),
+            started_at=np.array(started_at, dtype="datetime64[us]"),
+            completed_at=np.array(completed_at, dtype="datetime64[us]"),
+            **{field: np.frombuffer(column, dtype=np.int64) for field, column in ints.items()},
+        )
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    def duration_mask(self) -> np.ndarray:
+        """Маска заказов, выполнявшихся дольше MAX_DURATION (правило orders.duration_ok)."""
+        return self.completed_at - self.started_at > np.timedelta64(MAX_DURATION)
+
+    def count_mask(self) -> np.ndarray:
+        """Маска заказов, где completed + refunded + wait_refund != count (orders.services_counted)."""
+        return self.completed + self.refunded + self.wait_refund != self.count
+
+    def refund_mask(self) -> np.ndarray:
+        """Маска заказов, не выполняющих ни одного из условий orders.refunds_ok."""
+        # c >= count / 2 записано в целых числах, чтобы не переходить к float
+        condition1 = 2 * self.completed >= self.count
+        condition2 = (self.refunded <= self.completed) & (self.wait_refund <= self.refunded)
+        return ~(condition1 | condition2)
+
+    def duration_violations(self) -> np.ndarray:
+        """Индексы заказов, нарушающих правило длительности."""
+        return np.flatnonzero(self.duration_mask())
+
+    def count_violations(self) -> np.ndarray:
+        """Индексы заказов, где учтены не все услуги."""
+        return np.flatnonzero(self.count_mask())
+
+    def refund_violations(self) -> np.ndarray:
+        """Индексы заказов, нарушающих условия возвратов."""
+        return np.flatnonzero(self.refund_mask())
+
+    def violations(self) -> np.ndarray:
+        """Индексы заказов, нарушающих хотя бы одно правило (аналог непустого orders.order_errors)."""
+        return np.flatnonzero(self.duration_mask() | self.count_mask() | self.refund_mask())
+
+    def summary(self) -> dict:
+        """Суммарная статистика услуг, как в make_report."""
+        return {
+            "completed": int(self.completed.sum()),
+            "refunded": int(self.refunded.sum()),
+            "wait_refund": int(self.wait_refund.sum())
+        }
+
+
+def synthetic_orders(n: int, seed: int = 0) -> list:
+    """
+    Генерирует n заказов в формате orders["data"] со случайными нарушениями правил.
+
+    Args:
+        n (int): Количество заказов.
+        seed (int, optional): Зерно генератора для воспроизводимости.
+    """
+    rng = np.random.default_rng(seed)
+    count = rng.integers(1, 20, n)
+    completed = rng.integers(0, count + 1)
+    refunded = rng.integers(0, count - completed + 1)
+    wait_refund = count - completed - refunded + rng.choice([0, 0, 0, 1], n)
+    start = np.datetime64("2024-03-21T00:00:00.000") + rng.integers(0, 86_400_000, n).astype("timedelta64[ms]")
+    end = start + rng.integers(0, 8 * 3_600_000, n).astype("timedelta64[ms]")
+    return [
+        {
+            "_id": f"order-{i}",
+            "count": int(count[i]),
+            "brand_id": int(80000 + i % 500),
+            "delay": 1,
+            "startedAt": f"{start[i]}Z",
+            "completedAt": f"{end[i]}Z",
+            "completed": int(completed[i]),
+            "wait_refund": int(wait_refund[i]),
+            "refunded": int(refunded[i])
+        }
+        for i in range(n)
+    ]
+
+
+def test_columns_match_dict_rules() -> None:
+    """
+    Проверяет, что векторные проверки находят те же заказы, что и orders.order_errors.
+    """
+    from orders import duration_ok, make_report, order_errors, orders, refunds_ok, services_counted
+
+    data = synthetic_orders(2000) + orders["data"]
+    columns = OrderColumns.from_orders(data)
+    assert columns.duration_violations().tolist() == [i for i, o in enumerate(data) if not duration_ok(o)]
+    assert columns.count_violations().tolist() == [i for i, o in enumerate(data) if not services_counted(o)]
+    assert columns.refund_violations().tolist() == [i for i, o in enumerate(data) if not refunds_ok(o)]
+    assert columns.violations().tolist() == [i for i, o in enumerate(data) if order_errors(o)]
+    assert OrderColumns.from_orders(orders["data"]).summary() == make_report()["summary"]
+
+
+if __name__ == "__main__":
+    import sys
+    import time
+
+    from orders import order_errors
+
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 200_000
+    data = synthetic_orders(n)
+
+    started = time.perf_counter()
+    expected = [i for i, o in enumerate(data) if order_errors(o)]
+    dict_time = time.perf_counter() - started
+
+    started = time.perf_counter()
+    columns = OrderColumns.from_orders(data)
+    load_time = time.perf_counter() - started
+    started = time.perf_counter()
+    found = columns.violations()
+    check_time = time.perf_counter() - started
+
+    assert found.tolist() == expected
+    print(f"{n} заказов, нарушений: {len(found)}")
+    print(f"цикл по dict:       {dict_time:.3f} с")
+    print(f"загрузка в колонки: {load_time:.3f} с")
+    print(f"векторные проверки: {check_time:.4f} с ({dict_time / check_time:.0f}x быстрее цикла)")
@@ -0,0 +1,168 @@
+import datetime
+from dataclasses import asdict, dataclass
+from typing import Callable, Hashable, Iterable, Optional
+
+from orders import order_errors
+from timeparse import parse_iso
+
+
+@dataclass
+class GroupSummary:
+    """
+    Статистика по группе заказов.
+
+    Атрибуты:
+        orders (int): Количество заказов.
+        count (int): Сумма услуг.
+        completed (int): Сумма выполненных услуг.
+        refunded (int): Сумма возвращенных услуг.
+        wait_refund (int): Сумма услуг, ожидающих возврата.
+        invalid (int): Количество заказов, нарушающих правила orders.order_errors.
+    """
+    orders: int = 0
+    count: int = 0
+    completed: int = 0
+    refunded: int = 0
+    wait_refund: int = 0
+    invalid: int = 0
+
+    def apply(self, order: dict, invalid: bool, sign: int) -> None:
+        """Добавляет (sign=1) или вычитает (sign=-1) вклад заказа."""
+        self.orders += sign
+        self.count += sign * order["count"]
+        self.completed += sign * order["completed"]
+        self.refunded += sign * order["refunded"]
+        self.wait_refund += sign * order["wait_refund"]
+        self.invalid += sign * invalid
+
+
+class OrderIndex:
+    """
+    Индекс заказов с инкрементально обновляемой статистикой по brand_id.
+
+    Добавление, изменение, возврат и удаление заказа обновляют статистику его группы за O(1),
+    поэтому отчёт по живому потоку заказов не требует пересчёта всех заказов.
+
+    В самих заказах оператора нет (в выгрузке он один — orders.OPERATOR), поэтому для индекса
+    по нескольким выгрузкам оператор заказа определяет переданная функция operator_key.
+
+    Атрибуты:
+        operator_key (Callable | None): Функция, возвращающая оператора заказа для дополнительной группировки.
+        bucket (datetime.timedelta | None): Дополнительно группировать по интервалам startedAt.
+    """
+    def __init__(self, operator_key: Optional[Callable[[dict], Hashable]] = None,
+                 bucket: Optional[datetime.timedelta] = None) -> None:
+        self.operator_key = operator_key
+        self.bucket = bucket
+        self._orders = {}
+        self._groups = {}
+
+    def group_key(self, order: dict) -> tuple:
+        """
+        Возвращает ключ группы заказа: (brand_id[, operator][, начало интервала]).
+        """
+        key = (order["brand_id"],)
+        if self.operator_key is not None:
+            key += (self.operator_key(order),)
+        if self.bucket is not None:
+            started_at = parse_iso(order["startedAt"])
+            epoch = datetime.datetime(1970, 1, 1, tzinfo=started_at.tzinfo)
+            key += (started_at - (started_at - epoch) % self.bucket,)
+        return key
+
+    def __len__(self) -> int:
+        return len(self._orders)
+
+    def _remove_entry(self, order_id: str) -> None:
+        key, order, invalid = self._orders.pop(order_id)
+        group = self._groups[key]
+        group.apply(order, invalid, -1)
+        if group.orders == 0:
+            del self._groups[key]
+
+    def upsert(self, order: dict) -> None:
+        """
+        Добавляет заказ или заменяет ранее добавленный заказ с тем же _id.
+
+        Args:
+            order (dict): Заказ в формате orders["data"].
+        """
+        if order["_id"] in self._orders:
+            self._remove_entry(order["_id"])
+        order = dict(order)
+        key = self.group_key(order)
+        invalid = bool(order_errors(order))
+        self._groups.setdefault(key, GroupSummary()).apply(order, invalid, 1)
+        self._orders[order["_id"]] = (key, order, invalid)
+
+    def update_many(self, orders: Iterable[dict]) -> None:
+        """Применяет upsert к каждому заказу из потока."""
+        for order in orders:
+            self.upsert(order)
+
+    def refund(self, order_id: str, amount: int = 1) -> None:
+        """
+        Отмечает, что amount услуг заказа, ожидавших возврата, возвращены.
+
+        Raises:
+            KeyError: Если заказа нет в индексе.
+            ValueError: Если сумма не положительная или больше числа ожидающих возврата услуг.
+        """
+        order = self._orders[order_id][1]
+        if amount <= 0:
+            raise ValueError("Количество возвращаемых услуг должно быть положительным!")
+        if amount > order["wait_refund"]:
+            raise ValueError("Возвратов больше, чем услуг в ожидании возврата!")
+        self.upsert({**order, "wait_refund": order["wait_refund"] - amount,
+                     "refunded": order["refunded"] + amount})
+
+    def remove(self, order_id: str) -> None:
+        """Удаляет заказ из индекса."""
+        self._remove_entry(order_id)
+
+    def summary(self, *key) -> dict:
+        """
+        Возвращает статистику одной группы, например summary(88339).
+
+        Для индекса с operator_key или bucket ключ передаётся полностью: summary(brand_id, operator, ...).
+        """
+        group = self._groups.get(tuple(key))
+        return asdict(group if group is not None else GroupSummary())
+
+    def report(self) -> dict:
+        """Возвращает статистику всех групп по их ключам."""
+        return {key if len(key) > 1 else key[0]: asdict(group) for key, group in self._groups.items()}
+
+
+def test_order_index_incremental() -> None:
+    """
+    Проверяет, что статистика по brand_id после изменений совпадает с полным пересчётом.
+    """
+    from orders import OPERATOR, orders
+
+    index = OrderIndex()
+    index.update_many(orders["data"])
+    assert index.summary(88339) == {"orders": 2, "count": 18, "completed": 7, "refunded": 6,
+                                    "wait_refund": 5, "invalid": 1}
+
+    index.refund("4816385b-a5a5-4341-aedf-6f80bedbdce4", 2)
+    index.upsert({**orders["data"][0], "brand_id": 88339, "completed": 1})
+    index.remove("7e0882b5-38b8-4dcb-9825-625158a92314")
+
+    rebuilt = OrderIndex()
+    rebuilt.update_many([
+        {**orders["data"][0], "brand_id": 88339, "completed": 1},
+        {**orders["data"][1], "wait_refund": 0, "refunded": 2},
+    ])
+    assert index.report() == rebuilt.report() == {88339: {"orders": 2, "count": 3, "completed": 1, "refunded": 2,
+                                                          "wait_refund": 0, "invalid": 1}}
+
+    second_export = {orders["data"][1]["_id"]}
+    by_operator = OrderIndex(operator_key=lambda order: "other" if order["_id"] in second_export else OPERATOR)
+    by_operator.update_many(orders["data"])
+    assert by_operator.summary(88339, OPERATOR)["orders"] == 1
+    assert by_operator.summary(88339, "other")["orders"] == 1
+
+    hourly = OrderIndex(bucket=datetime.timedelta(hours=1))
+    hourly.update_many(orders["data"])
+    assert hourly.summary(88339, parse_iso("2024-03-21T16:00:00.000Z"))["orders"] == 2
@@ -0,0 +1,236 @@
+import json
+import time
+from typing import Iterator, Optional
+
+from orders import OPERATOR, order_errors
+
+CHUNK_SIZE = 1 << 16
+# Запись длиннее этого считается повреждённой: иначе разбор дочитывал бы в буфер весь остаток файла
+MAX_RECORD_SIZE = 1 << 24
+WHITESPACE = " \t\n\r"
+# Символы, которыми может продолжаться число, разрезанное границей куска
+NUMBER_CHARS = "0123456789.eE+-"
+
+
+class JsonStreamReader:
+    """
+    Читает JSON документ по частям, не загружая его в память целиком.
+
+    Поддерживает верхний уровень вида {"state": 0, "data": [...]} (как orders в orders.py)
+    и просто массив заказов [...]. Заказы из "data" отдаются по одному.
+
+    Атрибуты:
+        fields (dict): Поля верхнего уровня, кроме "data" (например, "state").
+    """
+    def __init__(self, file, chunk_size: int = CHUNK_SIZE, max_record_size: int = MAX_RECORD_SIZE) -> None:
+        self.fields = {}
+        self._file = file
+        self._chunk_size = chunk_size
+        self._max_record_size = max_record_size
+        self._decoder = json.JSONDecoder()
+        self._buffer = ""
+        self._pos = 0
+        self._eof = False
+
+    def _fill(self) -> bool:
+        """Дочитывает следующий кусок файла. Возвращает False, если файл закончился."""
+        if self._eof:
+            return False
+        chunk = self._file.read(self._chunk_size)
+        if not chunk:
+            self._eof = True
+            return False
+        # Прочитанное отбрасывается, чтобы буфер не рос вместе с файлом
+        self._buffer = self._buffer[self._pos:] + chunk
+        self._pos = 0
+        return True
+
+    def _peek(self) -> str:
+        """Пропускает пробелы и возвращает следующий символ ("" в конце файла)."""
+        while True:
+            while self._pos < len(self._buffer) and self._buffer[self._pos] in WHITESPACE:
+                self._pos += 1
+            if self._pos < len(self._buffer) or not self._fill():
+                return self._buffer[self._pos:self._pos + 1]
+
+    def _expect(self, char: str) -> None:
+        if self._peek() != char:
+            raise ValueError(f"Ожидался символ {char!r} на позиции {self._pos}")
+        self._pos += 1
+
+    def _decode(self):
+        """
+        Разбирает следующее JSON значение, дочитывая файл, пока значение не поместится в буфер.
+
+        Raises:
+            json.JSONDecodeError: Если значение повреждено или длиннее max_record_size символов.
+        """
+        self._peek()
+        while True:
+            try:
+                value, end = self._decoder.raw_decode(self._buffer, self._pos)
+            except json.JSONDecodeError:
+                if len(self._buffer) - self._pos > self._max_record_size or not self._fill():
+                    raise
+                continue
+            # Число на границе куска могло прочитаться не полностью ("1." + "25", "3e" + "5")
+            if (not isinstance(value, (dict, list, str))
+                    and (end == len(self._buffer) or self._buffer[end] in NUMBER_CHARS)
+                    and len(self._buffer) - self._pos <= self._max_record_size and self._fill()):
+                continue
+            self._pos = end
+            return value
+
+    def _iter_array(self) -> Iterator[dict]:
+        self._expect("[")
+        if self._peek() == "]":
+            self._pos += 1
+            return
+        while True:
+            yield self._decode()
+            if self._peek() == ",":
+                self._pos += 1
+                continue
+            self._expect("]")
+            return
+
+    def __iter__(self) -> Iterator[dict]:
+        if self._peek() == "[":
+            yield from self._iter_array()
+            return
+        self._expect("{")
+        while self._peek() != "}":
+            key = self._decode()
+            self._expect(":")
+            if key == "data":
+                yield from self._iter_array()
+            else:
+                self.fields[key] = self._decode()
+            if self._peek() == ",":
+                self._pos += 1
+        self._pos += 1
+
+
+def iter_ndjson(file) -> Iterator[dict]:
+    """Отдаёт заказы из NDJSON файла: по одному JSON объекту на строку."""
+    for line in file:
+        if line.strip():
+            yield json.loads(line)
+
+
+def make_stream_report(path: str, fmt: Optional[str] = None, max_invalid_ids: int = 100) -> dict:
+    """
+    Формирует отчёт по выгрузке заказов за один проход с постоянным потреблением памяти.
+
+    Каждый заказ проверяется правилами из orders.order_errors, суммы completed/refunded/wait_refund
+    считаются на лету, а ID заказов не накапливаются.
+
+    Args:
+        path (str): Путь к выгрузке в JSON или NDJSON.
+        fmt (str, optional): "json" или "ndjson". По умолчанию определяется по расширению файла.
+        max_invalid_ids (int, optional): Сколько ID некорректных заказов сохранить в отчёте.
+
+    Returns:
+        dict: Оператор, число заказов, суммарная статистика, нарушения и скорость обработки.
+    """
+    if fmt is None:
+        fmt = "ndjson" if path.endswith((".ndjson", ".jsonl")) else "json"
+    started = time.perf_counter()
+    total_orders = total_completed = total_refunded = total_wait_refund = 0
+    invalid = 0
+    invalid_ids = []
+    errors = {}
+    fields = {}
+
+    with open(path, encoding="utf-8") as file:
+        if fmt == "ndjson":
+            records = iter_ndjson(file)
+        else:
+            records = JsonStreamReader(file)
+            fields = records.fields
+        for order in records:
+            total_orders += 1
+            total_completed += order["completed"]
+            total_refunded += order["refunded"]
+            total_wait_refund += order["wait_refund"]
+            order_problems = order_errors(order)
+            if order_problems:
+                invalid += 1
+                if len(invalid_ids) < max_invalid_ids:
+                    invalid_ids.append(order["_id"])
+                for message in order_problems:
+                    errors[message] = errors.get(message, 0) + 1
+
+    elapsed = time.perf_counter() - started
+    return {
+        "operator": OPERATOR,
+        "state": fields.get("state"),
+        "orders": total_orders,
+        "summary": {
+            "completed": total_completed,
+            "refunded": total_refunded,
+            "wait_refund": total_wait_refund
+        },
+        "invalid": invalid,
+        "invalid_ids": invalid_ids,
+        "errors": errors,
+        "elapsed_s": round(elapsed, 3),
+        "orders_per_second": round(total_orders / elapsed) if elapsed else 0,
+    }
+
+
+def test_stream_report_matches_make_report(tmp_path) -> None:
+    """
+    Проверяет, что потоковый отчёт по JSON и NDJSON совпадает с make_report и находит нарушения.
+    """
+    from orders import make_report, orders
+
+    json_path = tmp_path / "orders.json"
+    json_path.write_text(json.dumps(orders, ensure_ascii=False, indent=2), encoding="utf-8")
+    ndjson_path = tmp_path / "orders.ndjson"
+    ndjson_path.write_text("\n".join(json.dumps(o) for o in orders["data"]), encoding="utf-8")
+
+    expected = make_report()["summary"]
+    for path in (json_path, ndjson_path):
+        report = make_stream_report(str(path))
+        assert report["orders"] == len(orders["data"])
+        assert report["summary"] == expected
+        assert report["invalid_ids"] == [o["_id"] for o in orders["data"] if order_errors(o)]
+    assert make_stream_report(str(json_path))["state"] == 0
+
+    # Маленькие куски проверяют разбор значений, разрезанных границей чтения
+    with open(json_path, encoding="utf-8") as file:
+        assert list(JsonStreamReader(file, chunk_size=7)) == orders["data"]
+
+
+def test_stream_reader_split_numbers_and_limits() -> None:
+    """
+    Проверяет числа, разрезанные границей чтения на точке или экспоненте, и отказ на повреждённой записи.
+    """
+    import io
+
+    import pytest
+
+    for document, expected in (('[1.25, 2]', [1.25, 2]), ('{"data": [1.25, 2]}', [1.25, 2]),
+                               ('[3e5, -1.5E-2, true, null]', [3e5, -1.5e-2, True, None])):
+        for chunk_size in range(1, 6):
+            assert list(JsonStreamReader(io.StringIO(document), chunk_size=chunk_size)) == expected
+
+    class CountingFile(io.StringIO):
+        consumed = 0
+
+        def read(self, size=-1):
+            chunk = super().read(size)
+            self.consumed += len(chunk)
+            return chunk
+
+    broken = CountingFile('[{"_id": "a", ' + '"x": 1, ' * 100_000 + ']')
+    with pytest.raises(json.JSONDecodeError):
+        list(JsonStreamReader(broken, chunk_size=64, max_record_size=1024))
+    assert broken.consumed < 2048
+
+
+if __name__ == "__main__":
+    import sys
+
+    print(json.dumps(make_stream_report(sys.argv[1]), ensure_ascii=False, indent=2))
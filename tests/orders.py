@@ -1,7 +1,8 @@
 import datetime
-from dateutil import parser
+from timeparse import parse_iso
 
 OPERATOR = ("mail@mail.ru", "Никита")
+MAX_DURATION = datetime.timedelta(hours=6)
 
 orders = {
     "state": 0,
@@ -43,6 +44,42 @@ orders = {
 }
 
 
+def duration_ok(order: dict) -> bool:
+    """Проверяет, что заказ выполнен не дольше MAX_DURATION."""
+    started_at = parse_iso(order["startedAt"])
+    completed_at = parse_iso(order["completedAt"])
+    return completed_at - started_at <= MAX_DURATION
+
+
+def services_counted(order: dict) -> bool:
+    """Проверяет, что сумма выполненных, возвращенных и ожидающих возврата услуг равна count."""
+    return order["completed"] + order["refunded"] + order["wait_refund"] == order["count"]
+
+
+def refunds_ok(order: dict) -> bool:
+    """
+    Проверяет, что выполняется хотя бы одно из условий:
+      - выполнено не менее половины услуг;
+      - возвращенных не больше выполненных, а ожидающих возврата не больше возвращенных.
+    """
+    c, r, w = order["completed"], order["refunded"], order["wait_refund"]
+    condition1 = c >= order["count"] / 2
+    condition2 = (r <= c) and (w <= r)
+    return condition1 or condition2
+
+
+def order_errors(order: dict) -> list:
+    """Возвращает сообщения о всех правилах test_orders, которые нарушает заказ."""
+    errors = []
+    if not duration_ok(order):
+        errors.append("Заказ выполнялся дольше 6 часов")
+    if not services_counted(order):
+        errors.append("Не все услуги учтены")
+    if not refunds_ok(order):
+        errors.append("Не выполнено ни одно условие")
+    return errors
+
+
 def test_orders():
     """
     Тестирует корректность данных заказов и логику их обработки.
@@ -64,19 +101,13 @@ def test_orders():
 
     # 2) Проверяем время первых двух заказов
     for i in range(min(2, len(orders["data"]))):
-        order = orders["data"][i]
-        started_at = parser.isoparse(order["startedAt"])
-        completed_at = parser.isoparse(order["completedAt"])
-        assert completed_at - started_at <= datetime.timedelta(hours=6)
+        assert duration_ok(orders["data"][i])
 
     # 3) Проверяем третий заказ
     if len(orders["data"]) >= 3:
         third = orders["data"][2]
-        c, r, w = third["completed"], third["refunded"], third["wait_refund"]
-        assert c + r + w == third["count"], "Не все услуги учтены"
-        condition1 = c >= third["count"] / 2
-        condition2 = (r <= c) and (w <= r)
-        assert condition1 or condition2, "Не выполнено ни одно условие"
+        assert services_counted(third), "Не все услуги учтены"
+        assert refunds_ok(third), "Не выполнено ни одно условие"
 
     # 4) Вызов main() — чтобы увидеть отчёт при запуске pytest -s
     main()
@@ -0,0 +1,112 @@
+import zlib
+from typing import Iterator, Optional
+
+import numpy as np
+
+
+class BookingFactory:
+    """
+    Генератор данных бронирований из заранее подготовленных пулов имён.
+
+    Faker импортируется и вызывается только при первом обращении, и лишь для заполнения пулов;
+    дальше имена выбираются из пулов, а цены генерируются векторно через NumPy.
+    При одинаковом seed генерируются одинаковые данные, независимо от размера пачек.
+
+    Атрибуты:
+        seed (int): Зерно генератора.
+        pool_size (int): Размер пулов имён и фамилий.
+        lastname_suffix (str): Суффикс, добавляемый к фамилиям (например, имя воркера xdist).
+        key (str): Имя последовательности (например, nodeid теста): при одном seed разные key
+            дают независимые последовательности из тех же пулов имён.
+    """
+    def __init__(self, seed: int = 0, pool_size: int = 1000, lastname_suffix: str = "", key: str = "") -> None:
+        self.seed = seed
+        self.pool_size = pool_size
+        self.lastname_suffix = lastname_suffix
+        self.key = key
+        entropy = [seed, zlib.crc32(key.encode("utf-8"))] if key else seed
+        # Отдельный генератор на каждое поле: последовательность не зависит от разбиения на пачки
+        self._first_rng, self._last_rng, self._price_rng = (
+            np.random.default_rng(child) for child in np.random.SeedSequence(entropy).spawn(3))
+        self._first_names = None
+        self._last_names = None
+
+    def _pools(self) -> tuple:
+        if self._first_names is None:
+            from faker import Faker
+
+            fake = Faker()
+            fake.seed_instance(self.seed)
+            self._first_names = [fake.first_name() for _ in range(self.pool_size)]
+            self._last_names = [fake.last_name() + self.lastname_suffix for _ in range(self.pool_size)]
+        return self._first_names, self._last_names
+
+    def derive(self, key: str) -> "BookingFactory":
+        """Возвращает генератор с последовательностью key, использующий уже заполненные пулы имён."""
+        factory = BookingFactory(self.seed, self.pool_size, self.lastname_suffix, key)
+        factory._first_names, factory._last_names = self._pools()
+        return factory
+
+    def batch(self, n: int) -> list:
+        """
+        Возвращает n бронирований в формате фикстуры booking_data.
+
+        Args:
+            n (int): Количество бронирований.
+        """
+        first_names, last_names = self._pools()
+        first = self._first_rng.integers(0, len(first_names), n).tolist()
+        last = self._last_rng.integers(0, len(last_names), n).tolist()
+        prices = self._price_rng.integers(100, 10000, n, endpoint=True).tolist()
+        return [
+            {
+                "firstname": first_names[i],
+                "lastname": last_names[j],
+                "totalprice": price,
+                "depositpaid": True,
+                "bookingdates": {
+                    "checkin": "2024-04-05",
+                    "checkout": "2024-04-08"
+                },
+                "additionalneeds": "Breakfast"
+            }
+            for i, j, price in zip(first, last, prices)
+        ]
+
+    def stream(self, batch_size: int = 1000, limit: Optional[int] = None) -> Iterator[dict]:
+        """
+        Лениво отдаёт бронирования, генерируя их пачками по batch_size.
+
+        Args:
+            batch_size (int, optional): Размер пачки.
+            limit (int, optional): Сколько всего бронирований отдать; по умолчанию — бесконечно.
+        """
+        produced = 0
+        while limit is None or produced < limit:
+            size = batch_size if limit is None else min(batch_size, limit - produced)
+            yield from self.batch(size)
+            produced += size
+
+    def one(self) -> dict:
+        """Возвращает одно бронирование."""
+        return self.batch(1)[0]
+
+
+def test_booking_factory_reproducible() -> None:
+    """
+    Проверяет, что данные воспроизводятся по seed и соответствуют формату booking_data.
+    """
+    first = BookingFactory(seed=42).batch(500)
+    assert first == BookingFactory(seed=42).batch(500)
+    assert first != BookingFactory(seed=43).batch(500)
+    assert all(100 <= booking["totalprice"] <= 10000 for booking in first)
+    assert list(BookingFactory(seed=42).stream(batch_size=64, limit=500)) == first
+
+    base = BookingFactory(seed=42)
+    derived = base.derive("tests/api.py::test_a").batch(50)
+    assert derived == BookingFactory(seed=42, key="tests/api.py::test_a").batch(50)
+    assert derived != base.derive("tests/api.py::test_b").batch(50)
+    assert base.batch(500) == first, "derive не должен сдвигать последовательность исходного генератора"
+
+    suffixed = BookingFactory(seed=1, lastname_suffix="-gw0").one()
+    assert suffixed["lastname"].endswith("-gw0")
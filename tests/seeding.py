@@ -0,0 +1,240 @@
+import asyncio
+import time
+from typing import Iterable
+
+import aiohttp
+import pytest
+
+from async_client import ApiResponse, AsyncBookingClient
+
+
+class BookingSeeder:
+    """
+    Массовое создание бронирований с гарантированным удалением.
+
+    Бронирования создаются параллельно через пул соединений AsyncBookingClient, их ID запоминаются,
+    а при выходе из async with все созданные бронирования удаляются, даже если тест упал.
+
+    Атрибуты:
+        client (AsyncBookingClient): Авторизованный клиент.
+        concurrency (int): Сколько запросов выполнять одновременно.
+        bookings (dict): Созданные бронирования: данные по ID.
+    """
+    def __init__(self, client: AsyncBookingClient, concurrency: int = 100) -> None:
+        self.client = client
+        self.concurrency = concurrency
+        self.bookings = {}
+
+    async def __aenter__(self) -> "BookingSeeder":
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.cleanup()
+
+    async def _run(self, items, action) -> None:
+        """
+        Выполняет action для всех items силами concurrency параллельных задач.
+
+        После первой ошибки задачи не берут новые items, но завершают начатые действия,
+        и только затем ошибка пробрасывается: созданное к этому моменту уже учтено в bookings.
+        """
+        iterator = iter(items)
+        errors = []
+
+        async def worker() -> None:
+            for item in iterator:
+                if errors:
+                    return
+                try:
+                    await action(item)
+                except Exception as error:
+                    errors.append(error)
+                    return
+
+        await asyncio.gather(*(worker() for _ in range(self.concurrency)))
+        if errors:
+            raise errors[0]
+
+    async def seed(self, payloads: Iterable[dict]) -> list:
+        """
+        Создаёт бронирования из payloads и возвращает их ID в порядке создания.
+
+        Raises:
+            AssertionError: Если сервер не создал какое-то бронирование.
+        """
+        created = []
+
+        async def create(booking_data: dict) -> None:
+            response = await self.client.create_booking(booking_data)
+            assert response.status == 200, f"Не удалось создать букинг, статус код {response.status}"
+            booking_id = response.data["bookingid"]
+            self.bookings[booking_id] = booking_data
+            created.append(booking_id)
+
+        await self._run(payloads, create)
+        return created
+
+    async def cleanup(self) -> int:
+        """
+        Удаляет все созданные бронирования. Возвращает, сколько удалено.
+
+        Бронирование считается удалённым и при ответе 405: значит, его уже удалили.
+        """
+        deleted = 0
+
+        async def delete(booking_id: int) -> None:
+            nonlocal deleted
+            try:
+                response = await self.client.delete_booking(booking_id)
+            except (aiohttp.ClientError, asyncio.TimeoutError):
+                return
+            if response.status in (201, 405):
+                self.bookings.pop(booking_id, None)
+                deleted += 1
+
+        # Второй проход повторяет удаления, не прошедшие из-за сетевых ошибок или 5xx
+        for _ in range(2):
+            await self._run(list(self.bookings), delete)
+        return deleted
+
+    def expected_ids(self, firstname: str, lastname: str) -> set:
+        """ID созданных бронирований с заданными именем и фамилией."""
+        return {booking_id for booking_id, booking in self.bookings.items()
+                if booking["firstname"] == firstname and booking["lastname"] == lastname}
+
+
+async def check_filters(seeder: BookingSeeder, samples: int = 50) -> dict:
+    """
+    Проверяет GET /booking с фильтрами по известному набору и замеряет время списка и фильтров.
+
+    Сервер может хранить и чужие бронирования, поэтому сравниваются только ID из набора seeder.
+    """
+    seeded = set(seeder.bookings)
+    started = time.perf_counter()
+    all_ids = await seeder.client.get_booking_ids()
+    list_time = time.perf_counter() - started
+    assert all_ids.status == 200
+    assert seeded <= {item["bookingid"] for item in all_ids.data}, "В списке нет части созданных букингов"
+
+    pairs = sorted({(b["firstname"], b["lastname"]) for b in seeder.bookings.values()})[:samples]
+    filter_times = []
+    for firstname, lastname in pairs:
+        started = time.perf_counter()
+        response = await seeder.client.get_booking_ids(firstname, lastname)
+        filter_times.append(time.perf_counter() - started)
+        assert response.status == 200
+        found = {item["bookingid"] for item in response.data} & seeded
+        assert found == seeder.expected_ids(firstname, lastname), f"Фильтр {firstname} {lastname} вернул не те букинги"
+    return {"bookings": len(seeded), "list_ms": round(list_time * 1000, 3),
+            "filter_mean_ms": round(sum(filter_times) / len(filter_times) * 1000, 3),
+            "filters_checked": len(pairs)}
+
+
+class FlakyClient:
+    """Заглушка AsyncBookingClient: хранит бронирования в памяти, третье удаление падает с сетевой ошибкой."""
+    def __init__(self, fail_create: int = 0) -> None:
+        self.stored = set()
+        self.creates = 0
+        self.deletes = 0
+        self.fail_create = fail_create
+
+    async def create_booking(self, booking_data: dict) -> ApiResponse:
+        self.creates += 1
+        await asyncio.sleep(0)
+        if self.creates == self.fail_create:
+            return ApiResponse(500, "Internal Server Error")
+        booking_id = self.creates
+        self.stored.add(booking_id)
+        return ApiResponse(200, {"bookingid": booking_id, "booking": booking_data})
+
+    async def delete_booking(self, booking_id: int) -> ApiResponse:
+        self.deletes += 1
+        if self.deletes == 3:
+            raise aiohttp.ClientConnectionError("connection reset")
+        self.stored.discard(booking_id)
+        return ApiResponse(201, "Created")
+
+
+def test_cleanup_retries_network_errors() -> None:
+    """
+    Проверяет, что сетевая ошибка при удалении не прерывает очистку и бронирование удаляется повторно.
+    """
+    client = FlakyClient()
+
+    async def scenario() -> BookingSeeder:
+        async with BookingSeeder(client, concurrency=4) as seeder:
+            await seeder.seed([{"firstname": "a", "lastname": "b"}] * 10)
+        return seeder
+
+    seeder = asyncio.run(scenario())
+    assert client.stored == set()
+    assert seeder.bookings == {}
+
+
+def test_seed_stops_after_failed_create() -> None:
+    """
+    Проверяет, что после неудачного создания остальные задачи не создают новые бронирования,
+    а всё созданное удаляется.
+    """
+    client = FlakyClient(fail_create=5)
+
+    async def scenario() -> None:
+        async with BookingSeeder(client, concurrency=4) as seeder:
+            await seeder.seed([{"firstname": "a", "lastname": "b"}] * 100)
+
+    with pytest.raises(AssertionError, match="статус код 500"):
+        asyncio.run(scenario())
+    assert client.creates < 10
+    assert client.stored == set()
+
+
+class TestSeededFilters:
+    """
+    Класс для тестирования списка и фильтров бронирований на заранее созданном наборе данных.
+    """
+
+    @pytest.mark.asyncio
+    async def test_filters_on_seeded_dataset(self, booking_seeder, booking_factory):
+        """
+        Создаёт 2000 бронирований с повторяющимися именами и проверяет результаты фильтров.
+        """
+        created = await booking_seeder.seed(booking_factory.batch(2000))
+        assert len(created) == 2000
+        stats = await check_filters(booking_seeder)
+        print(f"Проверка фильтров: {stats}")
+
+
+if __name__ == "__main__":
+    import argparse
+
+    import constant
+    from fake_booker import FakeBooker
+    from payloads import BookingFactory
+
+    arg_parser = argparse.ArgumentParser(description="Массовое создание бронирований и проверка фильтров")
+    arg_parser.add_argument("--base-url", default=constant.BASE_URL,
+                            help='адрес API; "fake" поднимает локальный restful-booker')
+    arg_parser.add_argument("--count", type=int, default=10_000)
+    arg_parser.add_argument("--concurrency", type=int, default=100)
+    arg_parser.add_argument("--seed", type=int, default=0)
+    args = arg_parser.parse_args()
+
+    async def main(base_url: str) -> None:
+        async with AsyncBookingClient(base_url, pool_size=args.concurrency) as client:
+            await client.auth()
+            async with BookingSeeder(client, args.concurrency) as seeder:
+                started = time.perf_counter()
+                # Небольшие пулы имён, чтобы фильтры находили по нескольку бронирований
+                await seeder.seed(BookingFactory(args.seed, pool_size=100).stream(limit=args.count))
+                elapsed = time.perf_counter() - started
+                print(f"Создано {len(seeder.bookings)} букингов за {elapsed:.2f} с "
+                      f"({len(seeder.bookings) / elapsed:.0f} в секунду)")
+                print(await check_filters(seeder))
+            print(f"Удалено, осталось: {len(seeder.bookings)}")
+
+    server = FakeBooker().start() if args.base_url == constant.FAKE_BASE_URL else None
+    try:
+        asyncio.run(main(server.base_url if server else args.base_url))
+    finally:
+        if server:
+            server.stop()
@@ -0,0 +1,81 @@
+import datetime
+from functools import lru_cache
+
+# Сколько последних разных строк времени держать в кэше
+CACHE_SIZE = 1 << 16
+
+
+def _is_fixed_format(value: str) -> bool:
+    """Проверяет, что строка имеет вид YYYY-MM-DDTHH:MM:SS.mmmZ, как startedAt/completedAt в заказах."""
+    return (len(value) == 24 and value[4] == "-" and value[7] == "-" and value[10] == "T"
+            and value[13] == ":" and value[16] == ":" and value[19] == "." and value[23] == "Z")
+
+
+@lru_cache(maxsize=CACHE_SIZE)
+def parse_iso(value: str) -> datetime.datetime:
+    """
+    Разбирает время в формате ISO-8601.
+
+    Формат YYYY-MM-DDTHH:MM:SS.mmmZ разбирается встроенным datetime.fromisoformat,
+    всё остальное передаётся в dateutil.parser.isoparse, который импортируется только при
+    первой такой строке. Результаты кэшируются, так как у заказов часто совпадает время.
+
+    Args:
+        value (str): Строка времени.
+
+    Returns:
+        datetime.datetime: Время с часовым поясом, если он указан в строке.
+    """
+    if _is_fixed_format(value):
+        try:
+            return datetime.datetime.fromisoformat(value[:-1] + "+00:00")
+        except ValueError:
+            pass
+    from dateutil import parser
+
+    return parser.isoparse(value)
+
+
+def test_parse_iso_matches_isoparse() -> None:
+    """
+    Проверяет, что результат совпадает с dateutil.parser.isoparse для основного и прочих форматов.
+    """
+    from dateutil import parser
+
+    for value in ("2024-03-21T16:48:03.513Z", "2024-02-29T23:59:59.999Z", "2024-03-21T16:48:03Z",
+                  "2024-03-21T16:48:03.513+03:00", "2024-03-21", "2024-03-21T16:48:03.513456Z"):
+        assert parse_iso(value) == parser.isoparse(value), value
+        assert parse_iso(value).utcoffset() == parser.isoparse(value).utcoffset(), value
+
+
+if __name__ == "__main__":
+    import sys
+    import time
+
+    from dateutil import parser
+    from order_columns import synthetic_orders
+
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 200_000
+    values = []
+    for i, order in enumerate(synthetic_orders(n)):
+        # Как у первого заказа в orders.py: у части заказов начало и завершение совпадают
+        values += [order["startedAt"], order["startedAt"] if i % 3 == 0 else order["completedAt"]]
+
+    started = time.perf_counter()
+    expected = [parser.isoparse(value) for value in values]
+    isoparse_time = time.perf_counter() - started
+
+    started = time.perf_counter()
+    uncached = [parse_iso.__wrapped__(value) for value in values]
+    uncached_time = time.perf_counter() - started
+
+    parse_iso.cache_clear()
+    started = time.perf_counter()
+    parsed = [parse_iso(value) for value in values]
+    parse_time = time.perf_counter() - started
+
+    assert parsed == uncached == expected
+    print(f"{len(values)} строк времени, попаданий в кэш: {parse_iso.cache_info().hits}")
+    print(f"dateutil.isoparse:     {isoparse_time:.3f} с")
+    print(f"parse_iso без кэша:    {uncached_time:.3f} с ({isoparse_time / uncached_time:.1f}x)")
+    print(f"parse_iso с кэшем:     {parse_time:.3f} с ({isoparse_time / parse_time:.1f}x)")
@@ -0,0 +1,123 @@
+import hashlib
+import json
+import os
+import tempfile
+import time
+from typing import Optional
+
+from filelock import FileLock
+
+# Каталог кэша и время жизни токена можно переопределить переменными окружения
+CACHE_DIR = os.getenv("BOOKER_TOKEN_CACHE", os.path.join(tempfile.gettempdir(), "booker-tokens"))
+TOKEN_TTL = float(os.getenv("BOOKER_TOKEN_TTL", 1800))
+
+
+class TokenCache:
+    """
+    Токен restful-booker, закэшированный на диске и общий для всех процессов pytest.
+
+    Файл кэша привязан к адресу API и учётным данным. Чтение и обновление идут под файловой
+    блокировкой, поэтому одновременно стартующие воркеры делают не больше одного запроса /auth.
+
+    Атрибуты:
+        base_url (str): Адрес API.
+        path (str): Путь к файлу кэша.
+        ttl (float): Сколько секунд токен считается действительным.
+    """
+    def __init__(self, base_url: str, username: str, password: str,
+                 directory: str = CACHE_DIR, ttl: float = TOKEN_TTL) -> None:
+        self.base_url = base_url
+        self.ttl = ttl
+        self._credentials = {"username": username, "password": password}
+        key = hashlib.sha256(f"{base_url}\n{username}\n{password}".encode()).hexdigest()[:16]
+        os.makedirs(directory, exist_ok=True)
+        self.path = os.path.join(directory, f"{key}.json")
+        self._lock = FileLock(f"{self.path}.lock")
+
+    def get(self, session, rejected: Optional[str] = None) -> Optional[str]:
+        """
+        Возвращает действующий токен, при необходимости запрашивая новый через /auth.
+
+        Args:
+            session: Сессия requests для запроса /auth.
+            rejected (str, optional): Токен, который сервер только что отверг; он не будет
+                возвращён из кэша, даже если ещё не истёк.
+
+        Returns:
+            str | None: Токен или None, если авторизоваться не удалось.
+        """
+        with self._lock:
+            entry = self._read()
+            if entry and entry["token"] != rejected and time.time() - entry["created"] < self.ttl:
+                return entry["token"]
+            auth_response = session.post(f"{self.base_url}/auth", json=self._credentials)
+            token = auth_response.json().get("token") if auth_response.status_code == 200 else None
+            if token is not None:
+                self._write({"token": token, "created": time.time()})
+            return token
+
+    def _read(self) -> Optional[dict]:
+        try:
+            with open(self.path, encoding="utf-8") as file:
+                return json.load(file)
+        except (OSError, ValueError):
+            return None
+
+    def _write(self, entry: dict) -> None:
+        tmp_path = f"{self.path}.tmp"
+        fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+        with os.fdopen(fd, "w", encoding="utf-8") as file:
+            json.dump(entry, file)
+        os.replace(tmp_path, self.path)
+
+
+class RefreshOnForbidden:
+    """
+    Хук requests: при ответе 403 обновляет токен в кэше и один раз повторяет запрос с новым токеном.
+
+    Атрибуты:
+        token (str): Токен, который сейчас выставлен в сессии.
+    """
+    def __init__(self, session, cache: TokenCache, token: str) -> None:
+        self.session = session
+        self.cache = cache
+        self.token = token
+
+    def __call__(self, response, **kwargs):
+        if response.status_code != 403 or getattr(response.request, "token_refreshed", False):
+            return response
+        token = self.cache.get(self.session, rejected=self.token)
+        if token is None:
+            return response
+        self.token = token
+        self.session.headers["Cookie"] = f"token={token}"
+        retry = response.request.copy()
+        retry.headers["Cookie"] = f"token={token}"
+        retry.token_refreshed = True
+        response.close()
+        return self.session.send(retry, **kwargs)
+
+
+def test_token_cache_shared_and_refreshed(tmp_path) -> None:
+    """
+    Проверяет, что второй процесс берёт токен из кэша, а отвергнутый сервером токен обновляется.
+    """
+    import requests
+    from fake_booker import FakeBooker
+
+    with FakeBooker() as server:
+        session = requests.Session()
+        cache = TokenCache(server.base_url, "admin", "password123", directory=str(tmp_path))
+        token = cache.get(session)
+        assert token is not None
+        assert TokenCache(server.base_url, "admin", "password123", directory=str(tmp_path)).get(session) == token
+        assert len(server.store.tokens) == 1, "повторный запрос /auth при живом кэше"
+
+        booking_id = server.store.create({"firstname": "Jim", "lastname": "Brown", "totalprice": 1,
+                                          "depositpaid": True,
+                                          "bookingdates": {"checkin": "2018-01-01", "checkout": "2019-01-01"}})
+        server.store.tokens.clear()
+        session.headers["Cookie"] = f"token={token}"
+        session.hooks["response"].append(RefreshOnForbidden(session, cache, token))
+        assert session.delete(f"{server.base_url}/booking/{booking_id}").status_code == 201
+        assert cache.get(session) != token
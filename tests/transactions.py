@@ -0,0 +1,308 @@
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Iterable, NamedTuple, Optional
+
+import numpy as np
+
+from oop_practic import BankAccount, SavingsAccount
+
+
+class Transaction(NamedTuple):
+    """
+    Операция над счетом.
+
+    Атрибуты:
+        kind (str): "deposit", "withdraw" или "transfer".
+        account (int): Индекс счета в TransactionProcessor.accounts (для перевода — счет списания).
+        amount (float): Сумма операции.
+        target (int | None): Индекс счета зачисления для перевода.
+    """
+    kind: str
+    account: int
+    amount: float
+    target: Optional[int] = None
+
+
+class _Meeting:
+    """Точка встречи двух очередей шардов на переводе: первая пришедшая очередь откладывается здесь."""
+    def __init__(self) -> None:
+        self.lock = threading.Lock()
+        self.parked = None
+
+
+class TransactionProcessor:
+    """
+    Потокобезопасная обработка операций над счетами BankAccount.
+
+    Счета распределены по шардам, у каждого шарда своя блокировка. Поток операций делится на очереди
+    шардов, которые обрабатываются параллельно; перевод между шардами согласует обе очереди
+    (см. process), поэтому результат совпадает с последовательным выполнением потока.
+
+    Атрибуты:
+        accounts (list): Счета, к которым обращаются операции по индексу.
+    """
+    def __init__(self, accounts: list, shards: int = 64) -> None:
+        self.accounts = accounts
+        self._locks = [threading.Lock() for _ in range(shards)]
+
+    def _lock(self, index: int) -> threading.Lock:
+        return self._locks[index % len(self._locks)]
+
+    def deposit(self, index: int, amount: float) -> None:
+        """Вносит депозит на счет под блокировкой его шарда."""
+        with self._lock(index):
+            self.accounts[index].deposit(amount)
+
+    def withdraw(self, index: int, amount: float) -> None:
+        """Снимает сумму со счета под блокировкой его шарда."""
+        with self._lock(index):
+            self.accounts[index].withdraw(amount)
+
+    def transfer(self, source: int, target: int, amount: float) -> None:
+        """
+        Атомарно переводит сумму между счетами: либо выполняются и списание, и зачисление, либо ничего.
+
+        Блокировки шардов берутся в порядке возрастания номера, что исключает взаимную блокировку
+        встречных переводов.
+
+        Raises:
+            ValueError: Если сумма не положительная или на счете списания недостаточно средств.
+        """
+        locks = [self._locks[i] for i in sorted({source % len(self._locks), target % len(self._locks)})]
+        for lock in locks:
+            lock.acquire()
+        try:
+            self.accounts[source].withdraw(amount)
+            self.accounts[target].deposit(amount)
+        finally:
+            for lock in reversed(locks):
+                lock.release()
+
+    def apply(self, transaction: Transaction) -> None:
+        """Выполняет одну операцию."""
+        if transaction.kind == "deposit":
+            self.deposit(transaction.account, transaction.amount)
+        elif transaction.kind == "withdraw":
+            self.withdraw(transaction.account, transaction.amount)
+        elif transaction.kind == "transfer":
+            self.transfer(transaction.account, transaction.target, transaction.amount)
+        else:
+            raise ValueError(f"Неизвестный тип операции: {transaction.kind}")
+
+    def _run(self, batch: list) -> list:
+        failed = []
+        for position, transaction in batch:
+            try:
+                self.apply(transaction)
+            except ValueError as error:
+                failed.append((position, str(error)))
+        return failed
+
+    def process(self, transactions: Iterable[Transaction], workers: int = 8) -> list:
+        """
+        Выполняет поток операций в пуле потоков.
+
+        Операции раскладываются в очереди шардов в порядке поступления; перевод между разными шардами
+        ставится в обе очереди. Первая дошедшая до перевода очередь откладывается (поток пула
+        при этом не блокируется и берёт другую работу), вторая выполняет перевод под блокировками
+        обоих шардов и возвращает отложенную очередь в пул. Так операции каждого счета выполняются
+        в порядке поступления без общего барьера на каждый перевод.
+
+        Операции BankAccount — чистый Python и под GIL не ускоряются от потоков: на таких счетах
+        process не быстрее последовательного выполнения (на потоке random_transactions примерно в 3 раза
+        медленнее). Выигрыш возможен, когда операции счетов отпускают GIL (ввод-вывод, вызовы в C).
+
+        Args:
+            transactions (Iterable[Transaction]): Операции в порядке поступления.
+            workers (int, optional): Размер пула потоков.
+
+        Returns:
+            list: Пары (номер операции в потоке, текст ошибки) для отклонённых операций.
+        """
+        shards = len(self._locks)
+        queues = [[] for _ in range(shards)]
+        for position, transaction in enumerate(transactions):
+            shard = transaction.account % shards
+            if transaction.kind == "transfer" and transaction.target % shards != shard:
+                meeting = _Meeting()
+                queues[shard].append((position, transaction, meeting))
+                queues[transaction.target % shards].append((position, transaction, meeting))
+            else:
+                queues[shard].append((position, transaction, None))
+        queues = [queue for queue in queues if queue]
+
+        failed = []
+        errors = []
+        remaining = len(queues)
+        state_lock = threading.Lock()
+        finished = threading.Event()
+
+        def drain(queue: list, start: int) -> None:
+            nonlocal remaining
+            try:
+                for i in range(start, len(queue)):
+                    position, transaction, meeting = queue[i]
+                    if meeting is not None:
+                        with meeting.lock:
+                            if meeting.parked is None:
+                                meeting.parked = (queue, i + 1)
+                                return
+                    try:
+                        self.apply(transaction)
+                    except ValueError as error:
+                        failed.append((position, str(error)))
+                    if meeting is not None:
+                        executor.submit(drain, *meeting.parked)
+            except BaseException as error:
+                errors.append(error)
+                finished.set()
+                return
+            with state_lock:
+                remaining -= 1
+                if remaining == 0:
+                    finished.set()
+
+        if not queues:
+            return []
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            for queue in queues:
+                executor.submit(drain, queue, 0)
+            finished.wait()
+        if errors:
+            raise errors[0]
+        return sorted(failed)
+
+    def apply_interest(self) -> None:
+        """
+        Начисляет проценты на все SavingsAccount одной векторной операцией.
+
+        На время начисления берутся блокировки всех шардов, поэтому оно не пересекается с операциями.
+        """
+        savings = [account for account in self.accounts if isinstance(account, SavingsAccount)]
+        if not savings:
+            return
+        for lock in self._locks:
+            lock.acquire()
+        try:
+            balances = np.fromiter((account.get_balance() for account in savings), dtype=np.float64,
+                                   count=len(savings))
+            rates = np.fromiter((account.interest_rate for account in savings), dtype=np.float64,
+                                count=len(savings))
+            for account, balance in zip(savings, (balances * (1 + rates)).tolist()):
+                # доступ к приватному атрибуту через _BankAccount__balance, как в SavingsAccount.apply_interest
+                account._BankAccount__balance = balance
+        finally:
+            for lock in reversed(self._locks):
+                lock.release()
+
+
+def expected_total(initial: float, transactions: list, failed: list) -> float:
+    """Считает, сколько денег должно быть на всех счетах после операций без отклонённых."""
+    rejected = {position for position, _ in failed}
+    total = initial
+    for position, transaction in enumerate(transactions):
+        if position in rejected:
+            continue
+        if transaction.kind == "deposit":
+            total += transaction.amount
+        elif transaction.kind == "withdraw":
+            total -= transaction.amount
+    return total
+
+
+def random_transactions(n: int, accounts: int, seed: int) -> list:
+    """Генерирует n случайных операций над accounts счетами с целыми суммами."""
+    import random
+
+    rng = random.Random(seed)
+    transactions = []
+    for _ in range(n):
+        kind = rng.choice(("deposit", "withdraw", "transfer"))
+        source, target = rng.randrange(accounts), rng.randrange(accounts)
+        transactions.append(Transaction(kind, source, rng.randint(1, 300), target if kind == "transfer" else None))
+    return transactions
+
+
+class YieldingAccount(BankAccount):
+    """
+    Счет, который отдаёт управление другим потокам между чтением и записью баланса.
+
+    Без блокировок TransactionProcessor операции над таким счетом гарантированно пересекаются:
+    теряются депозиты и проходят снятия сверх баланса.
+    """
+    def deposit(self, amount: float) -> None:
+        if amount <= 0:
+            raise ValueError("Сумма для депозита должна быть положительной!")
+        balance = self.get_balance()
+        time.sleep(0)
+        self._BankAccount__balance = balance + amount
+
+    def withdraw(self, amount: float) -> None:
+        if amount <= 0:
+            raise ValueError("Сумма для снятия должна быть положительной!")
+        balance = self.get_balance()
+        if amount > balance:
+            raise ValueError("Недостаточно средств!")
+        time.sleep(0)
+        self._BankAccount__balance = balance - amount
+
+
+def test_processor_consistent_under_contention() -> None:
+    """
+    Стресс-тест: много потоков одновременно работают с несколькими счетами, но деньги
+    не появляются и не пропадают, а обычные счета не уходят в минус.
+    """
+    accounts = [YieldingAccount(f"owner-{i}", 1000) for i in range(4)]
+    processor = TransactionProcessor(accounts, shards=4)
+    streams = [random_transactions(500, len(accounts), seed) for seed in range(16)]
+
+    with ThreadPoolExecutor(max_workers=len(streams)) as executor:
+        failures = list(executor.map(processor._run, [list(enumerate(stream)) for stream in streams]))
+
+    total = 4 * 1000
+    for stream, failed in zip(streams, failures):
+        assert all(message == "Недостаточно средств!" for _, message in failed)
+        total = expected_total(total, stream, failed)
+    assert sum(account.get_balance() for account in accounts) == total
+    assert all(account.get_balance() >= 0 for account in accounts)
+
+
+def test_process_stream() -> None:
+    """
+    Проверяет обработку потока операций по шардам в пуле потоков.
+    """
+    transactions = random_transactions(20_000, 16, seed=0)
+    sequential = [BankAccount(f"owner-{i}", 1000) for i in range(16)]
+    expected_failed = TransactionProcessor(sequential)._run(list(enumerate(transactions)))
+
+    # Один поток пула проверяет, что отложенные на переводах очереди не блокируют друг друга
+    for shards, workers in ((4, 4), (16, 1)):
+        accounts = [BankAccount(f"owner-{i}", 1000) for i in range(16)]
+        failed = TransactionProcessor(accounts, shards=shards).process(transactions, workers=workers)
+        assert sum(account.get_balance() for account in accounts) == expected_total(16 * 1000, transactions, failed)
+        assert failed == expected_failed
+        assert [account.get_balance() for account in accounts] == [account.get_balance() for account in sequential]
+
+
+def test_process_transfer_ordered() -> None:
+    """
+    Проверяет, что зачисление перевода выполняется до следующих в потоке операций счета зачисления,
+    даже если шард счета списания занят длинной пачкой операций.
+    """
+    accounts = [BankAccount("a", 0), BankAccount("b", 0)]
+    transactions = [Transaction("deposit", 1, 1)] * 20_000
+    transactions += [Transaction("transfer", 1, 100, 0), Transaction("withdraw", 0, 50)]
+    assert TransactionProcessor(accounts, shards=2).process(transactions, workers=2) == []
+    assert [account.get_balance() for account in accounts] == [50, 19_900]
+
+
+def test_apply_interest_vectorized() -> None:
+    """
+    Проверяет, что пакетное начисление процентов совпадает с SavingsAccount.apply_interest.
+    """
+    accounts = [SavingsAccount("a", 100), BankAccount("b", 100), SavingsAccount("c", 250)]
+    expected = SavingsAccount("c", 250)
+    expected.apply_interest()
+    TransactionProcessor(accounts).apply_interest()
+    assert [account.get_balance() for account in accounts] == [105, 100, expected.get_balance()]